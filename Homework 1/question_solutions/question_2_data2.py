@@ -34,29 +34,20 @@ def computeData2Prices(data: pd.DataFrame, close: float) -> pd.DataFrame:
         pd.DataFrame -- Formatted results DataFrame with DATA2 prices.
     """
 
-    # Creating Series for results
-    computed_prices = pd.Series()
-
-    for idx, option_data in data.iterrows():
-        # Isolating required arguments
-        volatility = option_data['implied_vol']
-        ttm = fe621.util.getTTM(name=option_data['name'],
-                                current_date=data2_date)
-        strike = fe621.util.getStrikePrice(name=option_data['name'])
-        
-        # Deciding price computation function based on type
-        if option_data['type'] == 'C':
-            computePrice = fe621.black_scholes.call
-        else:
-            computePrice = fe621.black_scholes.put
-
-        # Computing price
-        price = computePrice(current=close, volatility=volatility, ttm=ttm,
-                             strike=strike, rf=rf)
-        
-        # Adding to output Series
-        computed_prices.at[idx] = price
-    
+    # Isolating required arguments for the whole chain
+    volatility = data['implied_vol'].values
+    ttm = [fe621.util.getTTM(name=name, current_date=data2_date)
+           for name in data['name']]
+    strike = [fe621.util.getStrikePrice(name=name) for name in data['name']]
+    is_call = (data['type'] == 'C').values
+
+    # Computing prices for the whole chain in a single vectorized pass
+    computed_prices = pd.Series(
+        fe621.black_scholes.chainPrice(current=close, volatility=volatility,
+                                       ttm=ttm, strike=strike, rf=rf,
+                                       is_call=is_call),
+        index=data.index)
+
     # Copying `data` DataFrame for output
     results = data.copy(deep=True)
 
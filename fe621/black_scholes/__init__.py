@@ -3,4 +3,12 @@ from . import barrier
 from . import greeks
 from . import parity
 from .call import blackScholesCall as call
+from .chain import blackScholesChain as chain
+from .chain import blackScholesChainPrice as chainPrice
+from .chain import blackScholesChainInto as chainInto
+from .chain_context import ChainContext
+from .grid import evaluateGrid
+from .implied_vol_guess import impliedVolGuess
 from .put import blackScholesPut as put
+from .scenario import ScenarioGrid
+from .workspace import ChainWorkspace
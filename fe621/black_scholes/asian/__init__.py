@@ -1 +1,5 @@
+from .arithmetic import arithmeticAsian as arithmetic
 from .call import call
+from .chain import asianChain as chain
+from .greeks import asianGreeks
+from .put import put
@@ -0,0 +1,116 @@
+from .. import normal
+
+from scipy.special import exprel
+import numpy as np
+
+
+def arithmeticAsian(current: np.array, volatility: np.array, ttm: np.array,
+                    strike: np.array, rf: np.array, opt_type: str='C',
+                    dividend: np.array=0, avg_start: np.array=0,
+                    elapsed: np.array=0,
+                    running_avg: np.array=0) -> np.array:
+    """Function to compute the value of an arithmetic average price Asian
+    Option, using the Turnbull-Wakeman (Levy) moment matching approximation.
+
+    The (continuous) arithmetic average of the underlying over the remaining
+    averaging window is approximated by a lognormal variable with the same
+    first two moments, and the option is then valued with the Black (1976)
+    formula. Averaging windows that have already partially elapsed are
+    supported through the time elapsed in the window and the average realized
+    over it, which adjust the effective strike of the remaining average. All
+    numeric arguments may be scalars or arrays, and are broadcast against
+    each other.
+
+    See section 4.20.2 of Haug, The Complete Guide to Option Pricing Formulas
+    for more.
+
+    Arguments:
+        current {np.array} -- Current price of the underlying asset.
+        volatility {np.array} -- Volatility of the underlying asset price.
+        ttm {np.array} -- Time to expiration (in years), which is also the end
+                          of the averaging window.
+        strike {np.array} -- Strike price of the option contract.
+        rf {np.array} -- Risk-free rate (annual).
+
+    Keyword Arguments:
+        opt_type {str} -- Option type; must be 'C' or 'P' (default: {'C'}).
+        dividend {np.array} -- Dividend yield (default: {0}).
+        avg_start {np.array} -- Time until the averaging window starts (in
+                                years), for windows that have not yet started
+                                (default: {0}).
+        elapsed {np.array} -- Time already elapsed in the averaging window (in
+                              years), for windows that have already started
+                              (default: {0}).
+        running_avg {np.array} -- Average of the underlying price realized
+                                  over the elapsed part of the window
+                                  (default: {0}).
+
+    Raises:
+        ValueError: Raised if `opt_type` is not 'C' or 'P'.
+        ValueError: Raised if both `avg_start` and `elapsed` are positive.
+
+    Returns:
+        np.array -- Approximate price of the arithmetic Asian option.
+    """
+
+    # Verify option type choice
+    if opt_type not in ['C', 'P']:
+        raise ValueError('Incorrect option type; must be "C" or "P".')
+
+    # Option type sign; 1 for Calls, -1 for Puts
+    phi = 1 if opt_type == 'C' else -1
+
+    # Casting to arrays so that the inputs broadcast against each other
+    current, volatility, ttm, strike, rf, dividend, avg_start, elapsed, \
+        running_avg = [
+            np.asarray(x, dtype=float)
+            for x in (current, volatility, ttm, strike, rf, dividend,
+                      avg_start, elapsed, running_avg)
+        ]
+
+    # Verify averaging window; it has either started or not, not both
+    if np.any((avg_start > 0) & (elapsed > 0)):
+        raise ValueError('`avg_start` and `elapsed` cannot both be positive; '
+                         'a window that has not started has no elapsed '
+                         'time.')
+
+    # Cost of carry, and length of the remaining and full averaging windows
+    b = rf - dividend
+    var = np.power(volatility, 2)
+    remaining = ttm - avg_start
+    window = remaining + elapsed
+
+    # First two moments of the remaining average (relative to current price)
+    # NOTE: Using exprel(x) = (exp(x) - 1) / x, which is stable as x -> 0,
+    #       so that no special case is required for a zero cost of carry
+    a = (2 * b) + var
+    M1 = np.exp(b * avg_start) * exprel(b * remaining)
+    M2 = 2 * np.exp(a * avg_start) \
+        * (exprel(a * remaining) - exprel(b * remaining)) \
+        / ((b + var) * remaining)
+
+    # Forward of the remaining average, and volatility of the matched
+    # lognormal distribution (scaled by the square root of ttm)
+    forward = current * M1
+    total_vol = np.sqrt(np.log(M2 / np.power(M1, 2)))
+
+    # Effective strike of the remaining average, and its weight in the full
+    # average (adjusting for the realized part of the window)
+    weight = remaining / window
+    adj_strike = ((window * strike) - (elapsed * running_avg)) / remaining
+    disc = np.exp(-1 * rf * ttm)
+
+    # Money-ness probabilities (effective strike floored to keep log finite)
+    safe_strike = np.where(adj_strike > 0, adj_strike, 1)
+    d1 = (np.log(forward / safe_strike) / total_vol) + (0.5 * total_vol)
+    d2 = d1 - total_vol
+
+    price = weight * phi * disc * ((forward * normal.cdf(phi * d1))
+                                   - (safe_strike * normal.cdf(phi * d2)))
+
+    # Non-positive effective strike; Calls are certainly exercised, and are
+    # valued at the discounted expected payoff, while Puts are worthless
+    exercised = weight * disc * (forward - adj_strike)
+    deterministic = exercised if opt_type == 'C' else np.zeros_like(price)
+
+    return np.where(adj_strike > 0, price, deterministic)
@@ -1,6 +1,7 @@
+from .. import normal
+from .util import adjustedParameters
 from ...util.config import cfg
 
-from scipy.stats import norm
 import numpy as np
 
 def call(current: float, volatility: float, ttm: float, strike: float,
@@ -28,12 +29,9 @@ def call(current: float, volatility: float, ttm: float, strike: float,
         float -- Analytically computed price of the Asian call option.
     """
 
-    # Total number of trading days
-    N = days_in_year * ttm
-
     # Computing adjusted option metadata for analytical formula
-    adj_vol = volatility * np.sqrt(((2 * N) + 1) / (6 * (N + 1))) # Adjusted vol
-    rho = 0.5 * (rf - (np.power(volatility, 2) / 2) + np.power(adj_vol, 2))
+    adj_vol, rho = adjustedParameters(volatility=volatility, ttm=ttm, rf=rf,
+                                      fixings_per_year=days_in_year)
 
     # Money-ness probabilities
     d1 = (1 / (np.sqrt(ttm) * adj_vol)) * (np.log(current / strike) + ((rho + \
@@ -42,5 +40,5 @@ def call(current: float, volatility: float, ttm: float, strike: float,
         (0.5 * np.power(adj_vol, 2))) * ttm))
     
     # Computing final price with formula; return
-    return np.exp(-1 * rf * ttm) * ((current * np.exp(rho * ttm) * norm.cdf(d1))
-        - (strike * norm.cdf(d2)))
+    return np.exp(-1 * rf * ttm) * ((current * np.exp(rho * ttm) *
+        normal.cdf(d1)) - (strike * normal.cdf(d2)))
@@ -0,0 +1,66 @@
+from .. import normal
+from .util import adjustedParameters
+from ...util.config import cfg
+
+from typing import Tuple
+import numpy as np
+
+
+def asianChain(current: np.array, volatility: np.array, ttm: np.array,
+               strike: np.array, rf: np.array,
+               fixings_per_year: float=cfg.days_in_year) \
+               -> Tuple[np.array, np.array]:
+    """Function to compute the values of both Asian (i.e. average value) Call
+    and Put Options over a grid of strikes and averaging windows at once,
+    under the same analytical formula as `asian.call` and `asian.put`.
+
+    All arguments may be scalars or arrays, and are broadcast against each
+    other (e.g. a column of maturities against a row of strikes). The adjusted
+    volatility and drift (rho) only depend on the maturity, volatility and
+    risk-free rate, so they are computed once per maturity and shared across
+    all strikes; the forward, discount factor and d1/d2 terms are shared
+    between the Call and Put values.
+
+    Arguments:
+        current {np.array} -- Current price of the underlying asset.
+        volatility {np.array} -- Volatility of the underlying asset price.
+        ttm {np.array} -- Time to expiration (in years).
+        strike {np.array} -- Strike price(s) of the option contracts.
+        rf {np.array} -- Risk-free rate (annual).
+
+    Keyword Arguments:
+        fixings_per_year {float} -- Number of averaging fixings per year; e.g.
+                                    252 for daily fixings on trading days, or
+                                    52 for weekly fixings
+                                    (default: {cfg.days_in_year}).
+
+    Returns:
+        Tuple[np.array, np.array] -- Tuple with the Call and Put values
+                                     respectively, each with the broadcast
+                                     shape of the inputs.
+    """
+
+    # Casting to arrays so that the inputs broadcast against each other
+    current, volatility, ttm, strike, rf = [
+        np.asarray(x, dtype=float)
+        for x in (current, volatility, ttm, strike, rf)
+    ]
+
+    # Per-maturity terms (not broadcast against the strikes)
+    adj_vol, rho = adjustedParameters(volatility=volatility, ttm=ttm, rf=rf,
+                                      fixings_per_year=fixings_per_year)
+    adj_vol_sqrt_ttm = adj_vol * np.sqrt(ttm)
+    disc = np.exp(-1 * rf * ttm)
+    disc_forward = disc * current * np.exp(rho * ttm)  # Discounted forward
+    drift = (rho + (0.5 * np.power(adj_vol, 2))) * ttm
+
+    # Money-ness probabilities (broadcast against the strikes)
+    d1 = (np.log(current / strike) + drift) / adj_vol_sqrt_ttm
+    d2 = d1 - adj_vol_sqrt_ttm
+    disc_strike = disc * strike
+
+    call = (disc_forward * normal.cdf(d1)) - (disc_strike * normal.cdf(d2))
+    put = (disc_strike * normal.cdf(-1 * d2)) \
+        - (disc_forward * normal.cdf(-1 * d1))
+
+    return (call, put)
@@ -0,0 +1,99 @@
+from .. import normal
+from .util import adjustedParameters
+from ...util.config import cfg
+
+import numpy as np
+
+
+def asianGreeks(current: np.array, volatility: np.array, ttm: np.array,
+                strike: np.array, rf: np.array, opt_type: str='C',
+                fixings_per_year: float=cfg.days_in_year) -> dict:
+    """Function to compute the value, Delta, Gamma, Vega and Theta of an Asian
+    (i.e. average value) Option in a single pass, under the same analytical
+    formula as `asian.call` and `asian.put`.
+
+    The formula is a Black (1976) formula on the forward
+    F = S * exp(rho * ttm), with total volatility adj_vol * sqrt(ttm) and
+    discount factor exp(-rf * ttm). The Greeks are computed in closed form by
+    applying the chain rule through the dependence of the forward, total
+    volatility and discount factor on the underlying price, volatility and
+    time to expiration (including through the adjusted volatility and rho).
+    All arguments may be scalars or arrays, and are broadcast against each
+    other. Theta is expressed per year.
+
+    Arguments:
+        current {np.array} -- Current price of the underlying asset.
+        volatility {np.array} -- Volatility of the underlying asset price.
+        ttm {np.array} -- Time to expiration (in years).
+        strike {np.array} -- Strike price of the option contract.
+        rf {np.array} -- Risk-free rate (annual).
+
+    Keyword Arguments:
+        opt_type {str} -- Option type; must be 'C' or 'P' (default: {'C'}).
+        fixings_per_year {float} -- Number of averaging fixings per year
+                                    (default: {cfg.days_in_year}).
+
+    Raises:
+        ValueError: Raised if `opt_type` is not 'C' or 'P'.
+
+    Returns:
+        dict -- Dictionary of arrays with keys 'price', 'delta', 'gamma',
+                'vega' and 'theta'.
+    """
+
+    # Verify option type choice
+    if opt_type not in ['C', 'P']:
+        raise ValueError('Incorrect option type; must be "C" or "P".')
+
+    # Option type sign; 1 for Calls, -1 for Puts
+    phi = 1 if opt_type == 'C' else -1
+
+    # Casting to arrays so that the inputs broadcast against each other
+    current, volatility, ttm, strike, rf = [
+        np.asarray(x, dtype=float)
+        for x in (current, volatility, ttm, strike, rf)
+    ]
+
+    # Adjusted volatility and drift, and the volatility adjustment factor
+    adj_vol, rho = adjustedParameters(volatility=volatility, ttm=ttm, rf=rf,
+                                      fixings_per_year=fixings_per_year)
+    adj_factor_sq = np.power(adj_vol / volatility, 2)
+    N = fixings_per_year * ttm
+
+    # Forward, total volatility and discount factor of the Black formula
+    growth = np.exp(rho * ttm)
+    forward = current * growth
+    total_vol = adj_vol * np.sqrt(ttm)
+    disc = np.exp(-1 * rf * ttm)
+
+    # Money-ness probabilities
+    d1 = (np.log(forward / strike) / total_vol) + (0.5 * total_vol)
+    d2 = d1 - total_vol
+    cdf_phi_d1 = normal.cdf(phi * d1)
+    pdf_d1 = normal.pdf(d1)
+
+    price = phi * disc * ((forward * cdf_phi_d1)
+                          - (strike * normal.cdf(phi * d2)))
+
+    # Partial derivatives of the Black formula
+    dP_dF = phi * disc * cdf_phi_d1
+    dP_dv = disc * forward * pdf_d1
+
+    # Sensitivities of rho and the total volatility to volatility
+    drho_dvol = volatility * (adj_factor_sq - 0.5)
+    dv_dvol = total_vol / volatility
+
+    # Sensitivities of rho and the total volatility to time to expiration
+    dadj_factor_sq_dttm = fixings_per_year / (6 * np.power(N + 1, 2))
+    drho_dttm = 0.5 * np.power(volatility, 2) * dadj_factor_sq_dttm
+    dv_dttm = np.power(volatility, 2) * ((dadj_factor_sq_dttm * ttm)
+                                         + adj_factor_sq) / (2 * total_vol)
+    dF_dttm = forward * (rho + (ttm * drho_dttm))
+
+    return {
+        'price': price,
+        'delta': dP_dF * growth,
+        'gamma': disc * growth * pdf_d1 / (current * total_vol),
+        'vega': (dP_dF * forward * ttm * drho_dvol) + (dP_dv * dv_dvol),
+        'theta': -1 * ((dP_dF * dF_dttm) + (dP_dv * dv_dttm) - (rf * price))
+    }
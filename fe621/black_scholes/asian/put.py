@@ -0,0 +1,44 @@
+from .. import normal
+from .util import adjustedParameters
+from ...util.config import cfg
+
+import numpy as np
+
+def put(current: float, volatility: float, ttm: float, strike: float,
+        rf: float, days_in_year: int=cfg.days_in_year) -> float:
+    """Function to compute the value of an Asian (i.e. average value) Put
+    Option under the Black-Scholes model world heuristic. The option is
+    parameterized using the underlying asset price, volatility,
+    time to expiration, strike price, and risk-free rate.
+
+    Note that this formulation utilizes a daily average computation window,
+    scaling the time to expiration by the number of days in a year.
+
+    Arguments:
+        current {float} -- Current price of the underlying asset.
+        volatility {float} -- Volatility of the underlying asset price.
+        ttm {float} -- Time to expiration (in years).
+        strike {float} -- Strike price of the option contract.
+        rf {float} -- Risk-free rate (annual).
+
+    Keyword Arguments:
+        days_in_year {int} -- Number of days in a trading year
+                              (default: {cfg.days_in_year}).
+
+    Returns:
+        float -- Analytically computed price of the Asian put option.
+    """
+
+    # Computing adjusted option metadata for analytical formula
+    adj_vol, rho = adjustedParameters(volatility=volatility, ttm=ttm, rf=rf,
+                                      fixings_per_year=days_in_year)
+
+    # Money-ness probabilities
+    d1 = (1 / (np.sqrt(ttm) * adj_vol)) * (np.log(current / strike) + ((rho + \
+        (0.5 * np.power(adj_vol, 2))) * ttm))
+    d2 = (1 / (np.sqrt(ttm) * adj_vol)) * (np.log(current / strike) + ((rho - \
+        (0.5 * np.power(adj_vol, 2))) * ttm))
+
+    # Computing final price with formula; return
+    return np.exp(-1 * rf * ttm) * ((strike * normal.cdf(-1 * d2)) -
+        (current * np.exp(rho * ttm) * normal.cdf(-1 * d1)))
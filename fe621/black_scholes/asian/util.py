@@ -0,0 +1,32 @@
+from typing import Tuple
+import numpy as np
+
+
+def adjustedParameters(volatility: np.array, ttm: np.array, rf: np.array,
+                       fixings_per_year: float) -> Tuple[np.array, np.array]:
+    """Helper function to compute the adjusted volatility and drift (rho) used
+    by the analytical Asian option formulas. These depend only on the
+    volatility, time to expiration, risk-free rate and averaging frequency, and
+    may therefore be shared across all strikes of a given maturity.
+
+    Arguments:
+        volatility {np.array} -- Volatility of the underlying asset price.
+        ttm {np.array} -- Time to expiration (in years).
+        rf {np.array} -- Risk-free rate (annual).
+        fixings_per_year {float} -- Number of averaging fixings per year (e.g.
+                                    the number of days in a year for a daily
+                                    average, or 52 for a weekly average).
+
+    Returns:
+        Tuple[np.array, np.array] -- Tuple with the adjusted volatility, and
+                                     the adjusted drift (rho) respectively.
+    """
+
+    # Total number of averaging fixings
+    N = fixings_per_year * ttm
+
+    # Computing adjusted option metadata for analytical formula
+    adj_vol = volatility * np.sqrt(((2 * N) + 1) / (6 * (N + 1))) # Adjusted vol
+    rho = 0.5 * (rf - (np.power(volatility, 2) / 2) + np.power(adj_vol, 2))
+
+    return (adj_vol, rho)
@@ -1 +1,4 @@
 from .call import callUpAndIn, callUpAndOut
+from .greeks import barrierGreeks
+from .reiner_rubinstein import barrierPrice as price
+from .reiner_rubinstein import discreteBarrier
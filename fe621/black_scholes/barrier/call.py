@@ -1,11 +1,13 @@
+from .. import normal
+from .reiner_rubinstein import discreteBarrier
 from .util import AnalyticalUtil
 
-from scipy.stats import norm
 import numpy as np
 
 
 def callUpAndIn(S: float, H: float, volatility: float, ttm: float,
-                 K: float, rf: float, dividend: float=0) -> float:
+                 K: float, rf: float, dividend: float=0,
+                 monitoring_freq: float=None) -> float:
     """Analytical formula to compute the value of an up and in Barrier option.
     
     See formula 5.1 in http://bit.ly/2JHoVbQ for more.
@@ -20,23 +22,33 @@ def callUpAndIn(S: float, H: float, volatility: float, ttm: float,
     
     Keyword Arguments:
         dividend {float} -- Dividend yield (default: {0}).
+        monitoring_freq {float} -- Number of barrier observations per year,
+                                   or None for continuous monitoring. See
+                                   `discreteBarrier` (default: {None}).
     
     Returns:
         float -- Analytical value of up and in call option.
     """
 
+    # Shifting barrier for discrete monitoring
+    if monitoring_freq is not None:
+        H = discreteBarrier(H=H, volatility=volatility, barrier_type='U',
+                            monitoring_freq=monitoring_freq)
+
     util = AnalyticalUtil(volatility=volatility, ttm=ttm, rf=rf,
                           dividend=dividend)
 
     return np.power((H / S), 2 * util.nu / np.power(volatility, 2)) *\
            (util.pBS(np.power(H, 2) / S, K) - util.pBS(np.power(H, 2) / S, H) +\
-           ((H - K) * np.exp(-1 * rf * ttm) * norm.cdf(-1 * util.dBS(H, S)))) +\
-           util.cBS(S, H) + ((H - K) * np.exp(-1 * rf * ttm) * norm.cdf(
+           ((H - K) * np.exp(-1 * rf * ttm) * normal.cdf(
+           -1 * util.dBS(H, S)))) +\
+           util.cBS(S, H) + ((H - K) * np.exp(-1 * rf * ttm) * normal.cdf(
            util.dBS(S, H)))
 
 
 def callUpAndOut(S: float, H: float, volatility: float, ttm: float, K: float,
-                 rf: float, dividend: float=0) -> float:
+                 rf: float, dividend: float=0,
+                 monitoring_freq: float=None) -> float:
     """Analytical formula to compute the value of an up and out barrier call
     option.
 
@@ -52,16 +64,24 @@ def callUpAndOut(S: float, H: float, volatility: float, ttm: float, K: float,
     
     Keyword Arguments:
         dividend {float} -- Dividend yield (default: {0}).
+        monitoring_freq {float} -- Number of barrier observations per year,
+                                   or None for continuous monitoring. See
+                                   `discreteBarrier` (default: {None}).
     
     Returns:
         float -- Analytical price of up and out barrier call option.
     """
 
+    # Shifting barrier for discrete monitoring
+    if monitoring_freq is not None:
+        H = discreteBarrier(H=H, volatility=volatility, barrier_type='U',
+                            monitoring_freq=monitoring_freq)
+
     util = AnalyticalUtil(volatility=volatility, ttm=ttm, rf=rf,
                           dividend=dividend)
 
     return util.cBS(S, K) - util.cBS(S, H) - ((H - K) * np.exp(-1 * rf * ttm)\
-        * norm.cdf(util.dBS(S, H))) - (np.power(H / S, 2 * util.nu / np.power(
+        * normal.cdf(util.dBS(S, H))) - (np.power(H / S, 2 * util.nu / np.power(
         volatility, 2)) * (util.cBS(np.power(H, 2) / S, K) - util.cBS(np.power(
-        H, 2) / S, H) - ((H - K) * np.exp(-1 * rf * ttm)) * norm.cdf(util.dBS(
+        H, 2) / S, H) - ((H - K) * np.exp(-1 * rf * ttm)) * normal.cdf(util.dBS(
         H, S))))
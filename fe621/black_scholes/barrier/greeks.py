@@ -0,0 +1,179 @@
+from .. import normal
+from .reiner_rubinstein import _block_coefficients
+
+import numpy as np
+
+
+def barrierGreeks(S: np.array, H: np.array, volatility: np.array,
+                  ttm: np.array, K: np.array, rf: np.array, opt_type: str,
+                  barrier_type: str, dividend: np.array=0,
+                  rebate: np.array=0) -> dict:
+    """Function to compute the value, Delta, Gamma, Vega and Theta of a
+    single-barrier European option in a single pass, under the
+    Reiner-Rubinstein formulas (see `barrier.price`).
+
+    Each building block of the formula is a sum of terms of the form
+    `c * N(z)`, where the log of the prefactor `c` and the argument `z` have
+    simple closed-form derivatives with respect to the underlying price,
+    volatility and time to maturity. The Greeks are computed exactly from
+    these, term by term, alongside the value. All numeric arguments may be
+    scalars or arrays, and are broadcast against each other. Theta is
+    expressed per year.
+
+    Arguments:
+        S {np.array} -- Current price.
+        H {np.array} -- Barrier price.
+        volatility {np.array} -- Volatility of the underlying.
+        ttm {np.array} -- Time to maturity (in years).
+        K {np.array} -- Strike price.
+        rf {np.array} -- Risk-free rate (annualized).
+        opt_type {str} -- Option type, 'C' for Call, 'P' for Put.
+        barrier_type {str} -- Barrier type; 'UI' (up and in), 'UO' (up and
+                              out), 'DI' (down and in) or 'DO' (down and out).
+
+    Keyword Arguments:
+        dividend {np.array} -- Dividend yield (default: {0}).
+        rebate {np.array} -- Cash rebate (default: {0}).
+
+    Raises:
+        ValueError: Raised if `opt_type` or `barrier_type` is invalid.
+
+    Returns:
+        dict -- Dictionary of arrays with keys 'price', 'delta', 'gamma',
+                'vega' and 'theta'.
+    """
+
+    # Verify option and barrier type choice
+    if (opt_type, barrier_type) not in _block_coefficients:
+        raise ValueError('`opt_type` must be \'C\' or \'P\' and '
+                         '`barrier_type` must be one of \'UI\', \'UO\', '
+                         '\'DI\' or \'DO\'.')
+
+    # Broadcasting the inputs against each other, so that every term (and
+    # Greek) has the same shape
+    S, H, volatility, ttm, K, rf, dividend, rebate = np.broadcast_arrays(*[
+        np.asarray(x, dtype=float)
+        for x in (S, H, volatility, ttm, K, rf, dividend, rebate)
+    ])
+
+    phi = 1 if opt_type == 'C' else -1
+    eta = 1 if barrier_type[0] == 'D' else -1
+
+    # Cost of carry, and volatility scaled by square root of ttm
+    b = rf - dividend
+    sqrt_ttm = np.sqrt(ttm)
+    vol_sqrt_ttm = volatility * sqrt_ttm
+    var = np.power(volatility, 2)
+
+    # Drift terms, and their derivatives with respect to volatility
+    mu = (b - (var / 2)) / var
+    dmu = -2 * b / (var * volatility)
+    lam = np.sqrt(np.power(mu, 2) + (2 * rf / var))
+    dlam = ((mu * dmu) - (2 * rf / (var * volatility))) / lam
+
+    # Log price ratios
+    log_S_K = np.log(S / K)
+    log_S_H = np.log(S / H)
+    log_H_S = -1 * log_S_H
+    log_H2_SK = log_H_S + log_H_S + log_S_K
+
+    # Prefactors (without their sign)
+    carry_disc = S * np.exp((b - rf) * ttm)
+    strike_disc = K * np.exp(-1 * rf * ttm)
+    rebate_disc = rebate * np.exp(-1 * rf * ttm)
+    H_S_2mu = np.exp(2 * mu * log_H_S)
+    H_S_2mu2 = H_S_2mu * np.exp(2 * log_H_S)
+
+    def term(coef, log_S, log_SS, log_vol, log_ttm, zeta, log_ratio,
+             ratio_sign, kappa, dkappa) -> np.array:
+        """Value, and derivatives w.r.t. S (first and second), volatility and
+        ttm, of `coef * N(z)`, where `log_*` are the derivatives of the log of
+        `coef`, and `z = zeta * ((log_ratio / (vol * sqrt(ttm))) +
+        (kappa * vol * sqrt(ttm)))`. `log_ratio` has derivative
+        `ratio_sign / S` w.r.t. S, and `dkappa` is the derivative of `kappa`
+        w.r.t. volatility.
+        """
+
+        # Argument of the normal CDF, and its derivatives
+        z = zeta * ((log_ratio / vol_sqrt_ttm) + (kappa * vol_sqrt_ttm))
+        z_S = zeta * ratio_sign / (S * vol_sqrt_ttm)
+        z_SS = -1 * z_S / S
+        z_vol = zeta * ((-1 * log_ratio / (volatility * vol_sqrt_ttm))
+                        + (sqrt_ttm * (kappa + (volatility * dkappa))))
+        z_ttm = zeta * ((-1 * log_ratio / vol_sqrt_ttm)
+                        + (kappa * vol_sqrt_ttm)) / (2 * ttm)
+
+        cdf = normal.cdf(z)
+        pdf = normal.pdf(z)
+
+        return np.array([
+            coef * cdf,
+            coef * ((log_S * cdf) + (pdf * z_S)),
+            coef * (((log_SS + np.power(log_S, 2)) * cdf)
+                    + (2 * log_S * pdf * z_S)
+                    + (pdf * (z_SS - (z * np.power(z_S, 2))))),
+            coef * ((log_vol * cdf) + (pdf * z_vol)),
+            coef * ((log_ttm * cdf) + (pdf * z_ttm))
+        ])
+
+    # Shared log-prefactor derivatives
+    inv_S = 1 / S
+    inv_S2 = np.power(inv_S, 2)
+    zero = np.zeros_like(inv_S)
+
+    # Vanilla-like blocks (A with log(S / K), and B with log(S / H))
+    A, B = [
+        term(phi * carry_disc, inv_S, -1 * inv_S2, zero, b - rf, phi,
+             log_ratio, 1, 1 + mu, dmu)
+        + term(-1 * phi * strike_disc, zero, zero, zero, -1 * rf, phi,
+               log_ratio, 1, mu, dmu)
+        for log_ratio in (log_S_K, log_S_H)
+    ]
+
+    # Reflected blocks (C with log(H^2 / (S * K)), and D with log(H / S))
+    C, D = [
+        term(phi * carry_disc * H_S_2mu2, -1 * ((2 * mu) + 1) * inv_S,
+             ((2 * mu) + 1) * inv_S2, 2 * dmu * log_H_S, b - rf, eta,
+             log_ratio, -1, 1 + mu, dmu)
+        + term(-1 * phi * strike_disc * H_S_2mu, -2 * mu * inv_S,
+               2 * mu * inv_S2, 2 * dmu * log_H_S, -1 * rf, eta, log_ratio,
+               -1, mu, dmu)
+        for log_ratio in (log_H2_SK, log_H_S)
+    ]
+
+    # Rebate blocks
+    E = term(rebate_disc, zero, zero, zero, -1 * rf, eta, log_S_H, 1, mu,
+             dmu) \
+        + term(-1 * rebate_disc * H_S_2mu, -2 * mu * inv_S, 2 * mu * inv_S2,
+               2 * dmu * log_H_S, -1 * rf, eta, log_H_S, -1, mu, dmu)
+    F = term(rebate * np.exp((mu + lam) * log_H_S), -1 * (mu + lam) * inv_S,
+             (mu + lam) * inv_S2, (dmu + dlam) * log_H_S, zero, eta, log_H_S,
+             -1, lam, dlam) \
+        + term(rebate * np.exp((mu - lam) * log_H_S), -1 * (mu - lam) * inv_S,
+               (mu - lam) * inv_S2, (dmu - dlam) * log_H_S, zero, eta,
+               log_H_S, -1, -1 * lam, -1 * dlam)
+
+    # Combining blocks with the coefficients for the option and barrier type
+    above, below = _block_coefficients[(opt_type, barrier_type)]
+    strike_above = K > H
+    result = sum(np.where(strike_above, a, b) * block
+                 for a, b, block in zip(above, below, (A, B, C, D, E, F))
+                 if a or b)
+
+    # Handling underlying prices already beyond the barrier
+    knocked = (S <= H) if barrier_type[0] == 'D' else (S >= H)
+    if np.any(knocked):
+        # Vanilla option (block A) for In options, constant rebate for Out
+        if barrier_type[1] == 'I':
+            knocked_value = A
+        else:
+            knocked_value = np.array([rebate, zero, zero, zero, zero])
+        result = np.where(knocked, knocked_value, result)
+
+    return {
+        'price': result[0],
+        'delta': result[1],
+        'gamma': result[2],
+        'vega': result[3],
+        'theta': -1 * result[4]
+    }
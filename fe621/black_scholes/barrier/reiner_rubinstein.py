@@ -0,0 +1,220 @@
+from .. import normal
+
+from typing import Tuple
+import numpy as np
+
+
+# Coefficients of the building blocks (A, B, C, D, E, F) of the
+# Reiner-Rubinstein formulas for each option and barrier type. The first tuple
+# applies when the strike is above the barrier, and the second otherwise.
+# See Haug, The Complete Guide to Option Pricing Formulas, section 4.17.1.
+_block_coefficients = {
+    ('C', 'DI'): ((0, 0, 1, 0, 1, 0), (1, -1, 0, 1, 1, 0)),
+    ('C', 'UI'): ((1, 0, 0, 0, 1, 0), (0, 1, -1, 1, 1, 0)),
+    ('P', 'DI'): ((0, 1, -1, 1, 1, 0), (1, 0, 0, 0, 1, 0)),
+    ('P', 'UI'): ((1, -1, 0, 1, 1, 0), (0, 0, 1, 0, 1, 0)),
+    ('C', 'DO'): ((1, 0, -1, 0, 0, 1), (0, 1, 0, -1, 0, 1)),
+    ('C', 'UO'): ((0, 0, 0, 0, 0, 1), (1, -1, 1, -1, 0, 1)),
+    ('P', 'DO'): ((1, -1, 1, -1, 0, 1), (0, 0, 0, 0, 0, 1)),
+    ('P', 'UO'): ((0, 1, 0, -1, 0, 1), (1, 0, -1, 0, 0, 1))
+}
+
+# Broadie-Glasserman-Kou constant, -zeta(1/2) / sqrt(2 * pi)
+_bgk_beta = 0.5826
+
+
+def discreteBarrier(H: np.array, volatility: np.array, barrier_type: str,
+                    monitoring_freq: float) -> np.array:
+    """Function to compute the continuously monitored barrier equivalent to a
+    discretely monitored barrier, using the Broadie-Glasserman-Kou correction.
+
+    The barrier is shifted away from the underlying price by a factor of
+    exp(0.5826 * volatility * sqrt(dt)), where dt is the time between barrier
+    observations; up for Up barriers, and down for Down barriers. The shifted
+    barrier may then be used in the continuous monitoring formulas.
+
+    See Broadie, Glasserman and Kou (1997), A Continuity Correction for
+    Discrete Barrier Options, for more.
+
+    Arguments:
+        H {np.array} -- Discretely monitored barrier price.
+        volatility {np.array} -- Volatility of the underlying.
+        barrier_type {str} -- Barrier type; 'U' or 'D' as the first character
+                              for Up and Down barriers respectively.
+        monitoring_freq {float} -- Number of barrier observations per year
+                                   (e.g. 252 for daily monitoring).
+
+    Returns:
+        np.array -- Equivalent continuously monitored barrier price.
+    """
+
+    # Shift is away from the underlying; up for Up, and down for Down barriers
+    sign = 1 if barrier_type[0] == 'U' else -1
+
+    return H * np.exp(sign * _bgk_beta * volatility
+                      * np.sqrt(1 / monitoring_freq))
+
+
+def barrierPrice(S: np.array, H: np.array, volatility: np.array,
+                 ttm: np.array, K: np.array, rf: np.array, opt_type: str,
+                 barrier_type: str, dividend: np.array=0,
+                 rebate: np.array=0,
+                 monitoring_freq: float=None) -> np.array:
+    """Analytical formula to compute the value of a single-barrier European
+    option, using the Reiner-Rubinstein formulas. All eight combinations of
+    Call/Put, Up/Down and In/Out are supported, with a cash rebate (paid at
+    expiry for In options that are never knocked in, and at the barrier hit
+    for Out options) and a continuous dividend yield.
+
+    The barrier is monitored continuously by default. If `monitoring_freq` is
+    given, the barrier is instead monitored discretely at that frequency, and
+    the formula is applied to the shifted barrier given by `discreteBarrier`
+    (i.e. the Broadie-Glasserman-Kou correction). All numeric arguments may be
+    scalars or arrays, and are broadcast against each other. The intermediate
+    terms are shared between all of the building blocks of the formula.
+
+    If the underlying price is already beyond the barrier, In options are
+    valued as the corresponding vanilla option, and Out options at the rebate.
+
+    See section 4.17.1 of Haug, The Complete Guide to Option Pricing Formulas
+    for more.
+
+    Arguments:
+        S {np.array} -- Current price.
+        H {np.array} -- Barrier price.
+        volatility {np.array} -- Volatility of the underlying.
+        ttm {np.array} -- Time to maturity (in years).
+        K {np.array} -- Strike price.
+        rf {np.array} -- Risk-free rate (annualized).
+        opt_type {str} -- Option type, 'C' for Call, 'P' for Put.
+        barrier_type {str} -- Barrier type; 'UI' (up and in), 'UO' (up and
+                              out), 'DI' (down and in) or 'DO' (down and out).
+
+    Keyword Arguments:
+        dividend {np.array} -- Dividend yield (default: {0}).
+        rebate {np.array} -- Cash rebate (default: {0}).
+        monitoring_freq {float} -- Number of barrier observations per year,
+                                   or None for continuous monitoring
+                                   (default: {None}).
+
+    Raises:
+        ValueError: Raised if `opt_type` or `barrier_type` is invalid.
+
+    Returns:
+        np.array -- Analytical value of the barrier option.
+    """
+
+    # Verify option and barrier type choice
+    if (opt_type, barrier_type) not in _block_coefficients:
+        raise ValueError('`opt_type` must be \'C\' or \'P\' and '
+                         '`barrier_type` must be one of \'UI\', \'UO\', '
+                         '\'DI\' or \'DO\'.')
+
+    # Casting to arrays so that the inputs broadcast against each other
+    S, H, volatility, ttm, K, rf, dividend, rebate = [
+        np.asarray(x, dtype=float)
+        for x in (S, H, volatility, ttm, K, rf, dividend, rebate)
+    ]
+
+    # Shifting barrier for discrete monitoring (keeping the monitored barrier
+    # to check whether the underlying price is already beyond it)
+    monitored_H = H
+    if monitoring_freq is not None:
+        H = discreteBarrier(H=H, volatility=volatility,
+                            barrier_type=barrier_type,
+                            monitoring_freq=monitoring_freq)
+
+    # Computing building blocks of the formula
+    blocks = _blocks(S=S, H=H, volatility=volatility, ttm=ttm, K=K, rf=rf,
+                     dividend=dividend, rebate=rebate,
+                     phi=1 if opt_type == 'C' else -1,
+                     eta=1 if barrier_type[0] == 'D' else -1)
+
+    # Combining blocks with the coefficients for the option and barrier type
+    above, below = _block_coefficients[(opt_type, barrier_type)]
+    strike_above = K > H
+    price = sum(np.where(strike_above, a, b) * block
+                for a, b, block in zip(above, below, blocks) if a or b)
+
+    # Handling underlying prices already beyond the barrier
+    knocked = (S <= monitored_H) if barrier_type[0] == 'D' \
+        else (S >= monitored_H)
+    if np.any(knocked):
+        # Vanilla option value is given by block A
+        knocked_value = blocks[0] if barrier_type[1] == 'I' else rebate
+        price = np.where(knocked, knocked_value, price)
+
+    return price
+
+
+def _blocks(S: np.array, H: np.array, volatility: np.array, ttm: np.array,
+            K: np.array, rf: np.array, dividend: np.array, rebate: np.array,
+            phi: int, eta: int) -> Tuple[np.array, ...]:
+    """Helper function to compute the building blocks (A, B, C, D, E, F) of the
+    Reiner-Rubinstein barrier option formulas, sharing intermediate terms.
+
+    Arguments:
+        S {np.array} -- Current price.
+        H {np.array} -- Barrier price.
+        volatility {np.array} -- Volatility of the underlying.
+        ttm {np.array} -- Time to maturity (in years).
+        K {np.array} -- Strike price.
+        rf {np.array} -- Risk-free rate (annualized).
+        dividend {np.array} -- Dividend yield.
+        rebate {np.array} -- Cash rebate.
+        phi {int} -- 1 for Call options, -1 for Put options.
+        eta {int} -- 1 for Down barriers, -1 for Up barriers.
+
+    Returns:
+        Tuple[np.array, ...] -- Tuple with blocks A, B, C, D, E and F.
+    """
+
+    # Cost of carry, and volatility scaled by square root of ttm
+    b = rf - dividend
+    vol_sqrt_ttm = volatility * np.sqrt(ttm)
+    var = np.power(volatility, 2)
+
+    # Drift and discounting terms
+    mu = (b - (var / 2)) / var
+    lam = np.sqrt(np.power(mu, 2) + (2 * rf / var))
+    mu_vol_sqrt_ttm = (1 + mu) * vol_sqrt_ttm
+    carry_disc = S * np.exp((b - rf) * ttm)  # Dividend-discounted price
+    strike_disc = K * np.exp(-1 * rf * ttm)  # Discounted strike
+
+    # Log price ratios
+    log_S_K = np.log(S / K)
+    log_S_H = np.log(S / H)
+    log_H_S = -1 * log_S_H
+
+    # Powers of the barrier to price ratio
+    H_S_2mu = np.exp(2 * mu * log_H_S)
+    H_S_2mu2 = H_S_2mu * np.exp(2 * log_H_S)
+
+    # Moneyness terms
+    x1 = (log_S_K / vol_sqrt_ttm) + mu_vol_sqrt_ttm
+    x2 = (log_S_H / vol_sqrt_ttm) + mu_vol_sqrt_ttm
+    y1 = ((log_H_S + log_H_S + log_S_K) / vol_sqrt_ttm) + mu_vol_sqrt_ttm
+    y2 = (log_H_S / vol_sqrt_ttm) + mu_vol_sqrt_ttm
+    z = (log_H_S / vol_sqrt_ttm) + (lam * vol_sqrt_ttm)
+
+    # Vanilla-like blocks
+    A = (phi * carry_disc * normal.cdf(phi * x1)) \
+        - (phi * strike_disc * normal.cdf(phi * (x1 - vol_sqrt_ttm)))
+    B = (phi * carry_disc * normal.cdf(phi * x2)) \
+        - (phi * strike_disc * normal.cdf(phi * (x2 - vol_sqrt_ttm)))
+
+    # Reflected blocks
+    C = (phi * carry_disc * H_S_2mu2 * normal.cdf(eta * y1)) \
+        - (phi * strike_disc * H_S_2mu * normal.cdf(eta * (y1 - vol_sqrt_ttm)))
+    D = (phi * carry_disc * H_S_2mu2 * normal.cdf(eta * y2)) \
+        - (phi * strike_disc * H_S_2mu * normal.cdf(eta * (y2 - vol_sqrt_ttm)))
+
+    # Rebate blocks (In options at expiry, and Out options at barrier hit)
+    E = rebate * np.exp(-1 * rf * ttm) \
+        * (normal.cdf(eta * (x2 - vol_sqrt_ttm))
+           - (H_S_2mu * normal.cdf(eta * (y2 - vol_sqrt_ttm))))
+    F = rebate * ((np.exp((mu + lam) * log_H_S) * normal.cdf(eta * z))
+                  + (np.exp((mu - lam) * log_H_S)
+                     * normal.cdf(eta * (z - (2 * lam * vol_sqrt_ttm)))))
+
+    return (A, B, C, D, E, F)
@@ -1,6 +1,5 @@
 from ..call import blackScholesCall
 from ..put import blackScholesPut
-from ..util import computeD1D2
 
 import numpy as np
 
@@ -1,6 +1,6 @@
+from . import normal
 from .util import computeD1D2
 
-from scipy.stats import norm
 import numpy as np
 
 
@@ -23,7 +23,7 @@ def blackScholesCall(current: float, volatility: float, ttm: float,
 
     d1, d2 = computeD1D2(current, volatility, ttm, strike, rf)
 
-    call = (current * norm.cdf(d1)) \
-        - (strike * np.exp(-1 * rf * ttm) * norm.cdf(d2))
+    call = (current * normal.cdf(d1)) \
+        - (strike * np.exp(-1 * rf * ttm) * normal.cdf(d2))
 
     return call
@@ -0,0 +1,192 @@
+from . import compiled
+from . import normal
+from .util import computeD1D2
+from .workspace import ChainWorkspace
+from ..util.backend import useNumba
+from ..util.config import resolveDtype
+
+from typing import Tuple
+import numpy as np
+
+
+def blackScholesChain(current: np.array, volatility: np.array, ttm: np.array,
+                      strike: np.array, rf: np.array, dtype: type=None) \
+                      -> Tuple[np.array, np.array]:
+    """Function to compute the Black-Scholes-Merton prices of both European
+    Call and Put Options over an entire option chain at once.
+
+    All arguments may be scalars or arrays, and are broadcast against each
+    other (i.e. a single underlying price can be priced against a vector of
+    strikes, or a matrix of minute-bar prices against a row of contracts).
+    The d1 and d2 terms, as well as the discounted strike, are computed once
+    and shared between the Call and Put prices.
+
+    Arguments:
+        current {np.array} -- Current price(s) of the underlying asset.
+        volatility {np.array} -- Volatility of the underlying asset price.
+        ttm {np.array} -- Time to expiration (in years).
+        strike {np.array} -- Strike price(s) of the option contracts.
+        rf {np.array} -- Risk-free rate (annual).
+
+    Keyword Arguments:
+        dtype {type} -- Floating point precision of the computation, or None
+                        to use `cfg.dtype` (default: {None}).
+
+    Returns:
+        Tuple[np.array, np.array] -- Tuple with the Call and Put prices
+                                     respectively, each with the broadcast
+                                     shape of the inputs.
+    """
+
+    # Casting to arrays (at the chosen precision) so that the inputs
+    # broadcast against each other
+    dtype = resolveDtype(dtype)
+    current, volatility, ttm, strike, rf = [
+        np.asarray(x, dtype=dtype)
+        for x in (current, volatility, ttm, strike, rf)
+    ]
+
+    # Fused compiled kernel, if the numba backend is enabled
+    if useNumba():
+        return compiled.chain(current, volatility, ttm, strike, rf)
+
+    # Single d1/d2 evaluation shared by both option types
+    d1, d2 = computeD1D2(current, volatility, ttm, strike, rf)
+
+    # Discounted strike (shared by both option types)
+    disc_strike = strike * np.exp(-1 * rf * ttm)
+
+    call = (current * normal.cdf(d1)) - (disc_strike * normal.cdf(d2))
+    put = (disc_strike * normal.cdf(-1 * d2)) - (current * normal.cdf(-1 * d1))
+
+    return (call, put)
+
+
+def blackScholesChainPrice(current: np.array, volatility: np.array,
+                           ttm: np.array, strike: np.array, rf: np.array,
+                           is_call: np.array, dtype: type=None) -> np.array:
+    """Function to compute the Black-Scholes-Merton prices of a mixed chain of
+    European Call and Put Options, selecting the price of each contract by its
+    type flag. See `blackScholesChain` for details on broadcasting.
+
+    Arguments:
+        current {np.array} -- Current price(s) of the underlying asset.
+        volatility {np.array} -- Volatility of the underlying asset price.
+        ttm {np.array} -- Time to expiration (in years).
+        strike {np.array} -- Strike price(s) of the option contracts.
+        rf {np.array} -- Risk-free rate (annual).
+        is_call {np.array} -- Boolean flag(s); True for Call options, False for
+                              Put options.
+
+    Keyword Arguments:
+        dtype {type} -- Floating point precision of the computation, or None
+                        to use `cfg.dtype` (default: {None}).
+
+    Returns:
+        np.array -- Price of each option contract, with the broadcast shape of
+                    the inputs.
+    """
+
+    # Casting to arrays (at the chosen precision) so that the inputs
+    # broadcast against each other
+    dtype = resolveDtype(dtype)
+    current, volatility, ttm, strike, rf = [
+        np.asarray(x, dtype=dtype)
+        for x in (current, volatility, ttm, strike, rf)
+    ]
+
+    # Fused compiled kernel, if the numba backend is enabled
+    if useNumba():
+        return compiled.chainPrice(current, volatility, ttm, strike, rf,
+                                   np.asarray(is_call, dtype=bool))
+
+    d1, d2 = computeD1D2(current, volatility, ttm, strike, rf)
+
+    # Option type sign; 1 for Calls, -1 for Puts
+    phi = np.where(is_call, 1.0, -1.0).astype(dtype)
+
+    return phi * ((current * normal.cdf(phi * d1))
+                  - (strike * np.exp(-1 * rf * ttm) * normal.cdf(phi * d2)))
+
+
+def blackScholesChainInto(current: np.array, volatility: np.array,
+                          ttm: np.array, strike: np.array, rf: np.array,
+                          workspace: ChainWorkspace, call_out: np.array=None,
+                          put_out: np.array=None) -> Tuple[np.array, np.array]:
+    """Allocation-free variant of `blackScholesChain`. Every intermediate term
+    is written into the buffers of a preallocated `ChainWorkspace`, and the
+    prices are written into the given output arrays (or the workspace's own
+    `call` and `put` buffers if none are given).
+
+    The inputs must broadcast to the shape of the workspace, and the
+    computation runs at the precision of the workspace. Note that the
+    returned arrays are overwritten by the next call using the same buffers.
+
+    Arguments:
+        current {np.array} -- Current price(s) of the underlying asset.
+        volatility {np.array} -- Volatility of the underlying asset price.
+        ttm {np.array} -- Time to expiration (in years).
+        strike {np.array} -- Strike price(s) of the option contracts.
+        rf {np.array} -- Risk-free rate (annual).
+        workspace {ChainWorkspace} -- Workspace sized to the chain.
+
+    Keyword Arguments:
+        call_out {np.array} -- Output array for the Call prices
+                               (default: {None}).
+        put_out {np.array} -- Output array for the Put prices
+                              (default: {None}).
+
+    Returns:
+        Tuple[np.array, np.array] -- Tuple with the Call and Put prices
+                                     respectively (i.e. `call_out` and
+                                     `put_out`).
+    """
+
+    ws = workspace
+
+    # Defaulting to the workspace output buffers
+    if call_out is None:
+        call_out = ws.call
+    if put_out is None:
+        put_out = ws.put
+
+    # Volatility scaled by square root of time to expiration
+    np.sqrt(ttm, out=ws.vol_sqrt_ttm)
+    np.multiply(ws.vol_sqrt_ttm, volatility, out=ws.vol_sqrt_ttm)
+
+    # d1 = (log(S / K) + (rf + vol^2 / 2) * ttm) / (vol * sqrt(ttm))
+    np.multiply(volatility, volatility, out=ws.scratch)
+    np.divide(ws.scratch, 2, out=ws.scratch)
+    np.add(ws.scratch, rf, out=ws.scratch)
+    np.multiply(ws.scratch, ttm, out=ws.scratch)
+    np.divide(current, strike, out=ws.d1)
+    np.log(ws.d1, out=ws.d1)
+    np.add(ws.d1, ws.scratch, out=ws.d1)
+    np.divide(ws.d1, ws.vol_sqrt_ttm, out=ws.d1)
+
+    # d2 = d1 - (vol * sqrt(ttm))
+    np.subtract(ws.d1, ws.vol_sqrt_ttm, out=ws.d2)
+
+    # Discounted strike
+    np.multiply(rf, ttm, out=ws.disc_strike)
+    np.negative(ws.disc_strike, out=ws.disc_strike)
+    np.exp(ws.disc_strike, out=ws.disc_strike)
+    np.multiply(ws.disc_strike, strike, out=ws.disc_strike)
+
+    # Call = S * N(d1) - K * exp(-rf * ttm) * N(d2)
+    normal.cdf(ws.d1, out=call_out)
+    np.multiply(call_out, current, out=call_out)
+    normal.cdf(ws.d2, out=ws.scratch)
+    np.multiply(ws.scratch, ws.disc_strike, out=ws.scratch)
+    np.subtract(call_out, ws.scratch, out=call_out)
+
+    # Put = K * exp(-rf * ttm) * N(-d2) - S * N(-d1)
+    np.negative(ws.d1, out=put_out)
+    normal.cdf(put_out, out=put_out)
+    np.multiply(put_out, current, out=put_out)
+    np.negative(ws.d2, out=ws.scratch)
+    normal.cdf(ws.scratch, out=ws.scratch)
+    np.multiply(ws.scratch, ws.disc_strike, out=ws.scratch)
+    np.subtract(ws.scratch, put_out, out=put_out)
+
+    return (call_out, put_out)
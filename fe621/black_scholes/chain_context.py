@@ -0,0 +1,292 @@
+from . import normal
+from .implied_vol_guess import impliedVolGuess
+from ..optimization import vectorNewtonSolver
+from ..util import option_metadata
+
+from typing import Tuple
+import numpy as np
+
+
+class ChainContext():
+    """Per-chain cache of the Black-Scholes inputs that are invariant within a
+    trading day.
+
+    For a fixed set of contracts and date, the time to expiration, strike,
+    log-strike, square root of time to expiration, discount factors and
+    option type of each contract do not change between minute bars. These are
+    computed once on construction, so that repricing, Greeks and implied
+    volatility solvers only need the changing inputs (i.e. the underlying price
+    and the volatility).
+
+    All methods broadcast the underlying price and volatility against the
+    contract axis (the last axis), so a column of minute-bar prices with
+    shape (bars, 1) yields a (bars, contracts) matrix.
+    """
+
+    def __init__(self, names: list, rf: float, current_date: str,
+                 dividend: float=0):
+        """Initialization method for the `ChainContext` class.
+
+        Arguments:
+            names {list} -- Names of the option contracts in the chain.
+            rf {float} -- Risk-free rate (annual).
+            current_date {str} -- Current date in the form: YYYY-MM-DD.
+
+        Keyword Arguments:
+            dividend {float} -- Dividend yield (annual) (default: {0}).
+        """
+
+        self.names = list(names)
+        self.rf = rf
+        self.dividend = dividend
+        self.current_date = current_date
+
+        # Contract metadata, parsed once for the whole chain
+        contracts = option_metadata.parseContracts(names=self.names,
+                                                   current_date=current_date)
+        self.is_call = contracts['is_call'].values
+        self.strike = contracts['strike'].values
+        self.ttm = contracts['ttm'].values
+
+        # Option type sign; 1 for Calls, -1 for Puts
+        self.phi = np.where(self.is_call, 1.0, -1.0)
+
+        # Invariant terms of the Black-Scholes formula
+        self.log_strike = np.log(self.strike)
+        self.sqrt_ttm = np.sqrt(self.ttm)
+        self.drift_ttm = (rf - dividend) * self.ttm
+        self.disc = np.exp(-1 * rf * self.ttm)
+        self.div_disc = np.exp(-1 * dividend * self.ttm)
+        self.disc_strike = self.strike * self.disc
+
+    def d1d2(self, current: np.array,
+             volatility: np.array) -> Tuple[np.array, np.array]:
+        """Function to compute d1 and d2 for every contract in the chain.
+
+        Arguments:
+            current {np.array} -- Current price(s) of the underlying asset.
+            volatility {np.array} -- Volatility (or implied volatilities).
+
+        Returns:
+            Tuple[np.array, np.array] -- Tuple with d1, and d2 respectively.
+        """
+
+        vol_sqrt_ttm = volatility * self.sqrt_ttm
+        d1 = (np.log(current) - self.log_strike + self.drift_ttm
+              + (0.5 * vol_sqrt_ttm * vol_sqrt_ttm)) / vol_sqrt_ttm
+
+        return (d1, d1 - vol_sqrt_ttm)
+
+    def prices(self, current: np.array,
+               volatility: np.array) -> Tuple[np.array, np.array]:
+        """Function to compute both the Call and Put price of every contract
+        in the chain (i.e. regardless of the contract type).
+
+        Arguments:
+            current {np.array} -- Current price(s) of the underlying asset.
+            volatility {np.array} -- Volatility (or implied volatilities).
+
+        Returns:
+            Tuple[np.array, np.array] -- Tuple with the Call and Put prices
+                                         respectively.
+        """
+
+        d1, d2 = self.d1d2(current=current, volatility=volatility)
+        disc_current = current * self.div_disc
+
+        call = (disc_current * normal.cdf(d1)) \
+            - (self.disc_strike * normal.cdf(d2))
+        put = (self.disc_strike * normal.cdf(-1 * d2)) \
+            - (disc_current * normal.cdf(-1 * d1))
+
+        return (call, put)
+
+    def price(self, current: np.array, volatility: np.array) -> np.array:
+        """Function to compute the price of every contract in the chain,
+        according to its type.
+
+        Arguments:
+            current {np.array} -- Current price(s) of the underlying asset.
+            volatility {np.array} -- Volatility (or implied volatilities).
+
+        Returns:
+            np.array -- Price of each option contract.
+        """
+
+        d1, d2 = self.d1d2(current=current, volatility=volatility)
+
+        return self.phi * (
+            (current * self.div_disc * normal.cdf(self.phi * d1))
+            - (self.disc_strike * normal.cdf(self.phi * d2)))
+
+    def vega(self, current: np.array, volatility: np.array) -> np.array:
+        """Function to compute the Vega of every contract in the chain.
+
+        Arguments:
+            current {np.array} -- Current price(s) of the underlying asset.
+            volatility {np.array} -- Volatility (or implied volatilities).
+
+        Returns:
+            np.array -- Vega of each option contract.
+        """
+
+        d1, _ = self.d1d2(current=current, volatility=volatility)
+
+        return current * self.div_disc * self.sqrt_ttm * normal.pdf(d1)
+
+    def greeks(self, current: np.array, volatility: np.array) -> dict:
+        """Function to compute the Delta, Gamma, Vega, Theta and Rho of every
+        contract in the chain, according to its type. See
+        `greeks.allGreeks` for the formulas; Theta is expressed per year.
+
+        Arguments:
+            current {np.array} -- Current price(s) of the underlying asset.
+            volatility {np.array} -- Volatility (or implied volatilities).
+
+        Returns:
+            dict -- Dictionary of arrays with keys 'delta', 'gamma', 'vega',
+                    'theta' and 'rho'.
+        """
+
+        d1, d2 = self.d1d2(current=current, volatility=volatility)
+        pdf_d1 = normal.pdf(d1)
+        cdf_phi_d1 = normal.cdf(self.phi * d1)
+        cdf_phi_d2 = normal.cdf(self.phi * d2)
+        disc_current = current * self.div_disc
+
+        return {
+            'delta': self.phi * self.div_disc * cdf_phi_d1,
+            'gamma': self.div_disc * pdf_d1
+                     / (current * volatility * self.sqrt_ttm),
+            'vega': disc_current * self.sqrt_ttm * pdf_d1,
+            'theta': (-1 * disc_current * pdf_d1 * volatility
+                      / (2 * self.sqrt_ttm))
+                     - (self.phi * self.rf * self.disc_strike * cdf_phi_d2)
+                     + (self.phi * self.dividend * disc_current * cdf_phi_d1),
+            'rho': self.phi * self.ttm * self.disc_strike * cdf_phi_d2
+        }
+
+    def impliedVol(self, current: np.array, price: np.array,
+                   tol: float=1e-8, max_iter: int=100, guess: np.array=None,
+                   upper: float=5.0) -> np.array:
+        """Function to solve the implied volatility of every contract in the
+        chain at once, for a matrix of option prices (e.g. minute bars by
+        contracts), handling Calls and Puts in the same pass.
+
+        Each element is solved with a safeguarded Newton iteration (see
+        `optimization.vectorNewtonSolver`); a bracket [lo, hi] containing the
+        root is maintained for every element, and any Newton step that leaves
+        the bracket (or has a vanishing Vega) is replaced by a bisection
+        step. Only the elements that have not yet converged are evaluated at
+        each iteration. Elements with no solution
+        in (0, upper] (i.e. prices outside the no-arbitrage bounds, or
+        missing prices) or that do not converge within `max_iter` iterations
+        are set to NaN.
+
+        Arguments:
+            current {np.array} -- Current price(s) of the underlying asset.
+            price {np.array} -- Option prices, broadcast against `current`
+                                with contracts on the last axis.
+
+        Keyword Arguments:
+            tol {float} -- Tolerance level of the estimate (i.e. of the step
+                           size) (default: {1e-8}).
+            max_iter {int} -- Maximum number of iterations (default: {100}).
+            guess {np.array} -- Initial volatility estimate(s), broadcast
+                                against `price` (e.g. the solutions of the
+                                previous bar), or None to use the closed-form
+                                approximation of each element (see
+                                `impliedVolGuess`), which is also used for NaN
+                                estimates (default: {None}).
+            upper {float} -- Upper bound of the volatility (default: {5.0}).
+
+        Returns:
+            np.array -- Implied volatility of each option price, with the
+                        broadcast shape of the inputs.
+        """
+
+        # Flattening the broadcast inputs, with the contract of each element
+        current, price = np.broadcast_arrays(np.asarray(current, dtype=float),
+                                             np.asarray(price, dtype=float))
+        shape = price.shape
+        current = current.ravel()
+        price = price.ravel()
+        index = np.broadcast_to(np.arange(len(self.names)), shape).ravel()
+
+        # Output, NaN unless a solution is found
+        vol = np.full(price.shape, np.nan)
+
+        # No-arbitrage bounds of the price (i.e. at zero and infinite vol)
+        disc_current = current * self.div_disc[index]
+        intrinsic = np.maximum(self.phi[index] * (disc_current
+                                                  - self.disc_strike[index]),
+                               0)
+        bound = np.where(self.is_call[index], disc_current,
+                         self.disc_strike[index])
+        with np.errstate(invalid='ignore'):
+            valid = (price > intrinsic) & (price < bound) \
+                & (self.ttm[index] > 0)
+
+        # Discarding prices above the price at the upper volatility bound
+        active = np.flatnonzero(valid)
+        upper_price, _ = self._priceVega(current[active], upper,
+                                         index[active])
+        active = active[upper_price > price[active]]
+
+        # Underlying price, option price and contract of the active elements
+        S = current[active]
+        P = price[active]
+        idx = index[active]
+
+        # Initial estimates; closed-form, unless given (and not NaN)
+        x = impliedVolGuess(price=P, current=S, ttm=self.ttm[idx],
+                            strike=self.strike[idx], rf=self.rf,
+                            is_call=self.is_call[idx], dividend=self.dividend,
+                            upper=upper)
+        if guess is not None:
+            given = np.broadcast_to(np.asarray(guess, dtype=float),
+                                    shape).ravel()[active]
+            x = np.where(np.isnan(given), x, given)
+
+        # Objective (model less market price) and its derivative (Vega), for
+        # the unfinished active elements `i`
+        def objective(x: np.array, i: np.array) -> Tuple[np.array, np.array]:
+            model, vega = self._priceVega(S[i], x, idx[i])
+            return (model - P[i], vega)
+
+        # Newton's method, safeguarded by the (0, upper) bracket
+        result = vectorNewtonSolver(f=objective, f_prime=None, guess=x, a=0,
+                                    b=upper, tol=tol, max_iter=max_iter)
+        vol[active] = np.where(result.converged, result.root, np.nan)
+
+        return vol.reshape(shape)
+
+    def _priceVega(self, current: np.array, volatility: np.array,
+                   index: np.array) -> Tuple[np.array, np.array]:
+        """Helper function to compute the price and Vega of individual
+        elements of the chain (see `impliedVol`).
+
+        Arguments:
+            current {np.array} -- Underlying price of each element.
+            volatility {np.array} -- Volatility of each element.
+            index {np.array} -- Contract (column) index of each element.
+
+        Returns:
+            Tuple[np.array, np.array] -- Tuple with the price and Vega of each
+                                         element respectively.
+        """
+
+        phi = self.phi[index]
+        sqrt_ttm = self.sqrt_ttm[index]
+        disc_current = current * self.div_disc[index]
+
+        # Money-ness probabilities
+        vol_sqrt_ttm = volatility * sqrt_ttm
+        d1 = (np.log(current) - self.log_strike[index] + self.drift_ttm[index]
+              + (0.5 * vol_sqrt_ttm * vol_sqrt_ttm)) / vol_sqrt_ttm
+        d2 = d1 - vol_sqrt_ttm
+
+        price = phi * ((disc_current * normal.cdf(phi * d1))
+                       - (self.disc_strike[index] * normal.cdf(phi * d2)))
+
+        return (price, disc_current * sqrt_ttm * normal.pdf(d1))
@@ -0,0 +1,155 @@
+from ..util.backend import guvectorize, jit
+
+import math
+
+
+# Compiled Black-Scholes kernels, used in place of the NumPy implementations
+# when the numba backend is enabled (see `util.backend`). Without numba, these
+# are plain (slow) Python functions, and are not called by the library.
+
+# Square root of 2, for the normal CDF in terms of the complementary error
+# function
+_sqrt_2 = math.sqrt(2)
+
+
+@jit
+def cdf(x: float) -> float:
+    """Scalar standard normal CDF, in terms of the complementary error
+    function (as `scipy.special.ndtr` is not available in nopython mode).
+    """
+
+    return 0.5 * math.erfc(-1 * x / _sqrt_2)
+
+
+@jit
+def pdf(x: float) -> float:
+    """Scalar standard normal PDF.
+    """
+
+    return math.exp(-1 * x * x / 2) / math.sqrt(2 * math.pi)
+
+
+@jit
+def price(current: float, volatility: float, ttm: float, strike: float,
+          rf: float, is_call: bool) -> float:
+    """Scalar Black-Scholes price of a European Call or Put option.
+    """
+
+    vol_sqrt_ttm = volatility * math.sqrt(ttm)
+    d1 = (math.log(current / strike) + ((rf + (volatility * volatility / 2))
+                                        * ttm)) / vol_sqrt_ttm
+    d2 = d1 - vol_sqrt_ttm
+    disc_strike = strike * math.exp(-1 * rf * ttm)
+
+    if is_call:
+        return (current * cdf(d1)) - (disc_strike * cdf(d2))
+
+    return (disc_strike * cdf(-1 * d2)) - (current * cdf(-1 * d1))
+
+
+@jit
+def vega(current: float, volatility: float, ttm: float, strike: float,
+         rf: float) -> float:
+    """Scalar Black-Scholes Vega of a European option.
+    """
+
+    vol_sqrt_ttm = volatility * math.sqrt(ttm)
+    d1 = (math.log(current / strike) + ((rf + (volatility * volatility / 2))
+                                        * ttm)) / vol_sqrt_ttm
+
+    return current * math.sqrt(ttm) * pdf(d1)
+
+
+# NOTE: Single precision signatures are listed first, as the first loop that
+#       the inputs can be safely cast to is selected
+
+@guvectorize(['void(f4, f4, f4, f4, f4, f4[:], f4[:])',
+              'void(f8, f8, f8, f8, f8, f8[:], f8[:])'],
+             '(),(),(),(),()->(),()')
+def chain(current, volatility, ttm, strike, rf, call, put):
+    """Fused Black-Scholes Call and Put prices, as a generalized ufunc
+    broadcasting over its inputs (see `blackScholesChain`).
+    """
+
+    vol_sqrt_ttm = volatility * math.sqrt(ttm)
+    d1 = (math.log(current / strike) + ((rf + (volatility * volatility / 2))
+                                        * ttm)) / vol_sqrt_ttm
+    d2 = d1 - vol_sqrt_ttm
+    disc_strike = strike * math.exp(-1 * rf * ttm)
+
+    call[0] = (current * cdf(d1)) - (disc_strike * cdf(d2))
+    put[0] = (disc_strike * cdf(-1 * d2)) - (current * cdf(-1 * d1))
+
+
+@guvectorize(['void(f4, f4, f4, f4, f4, b1, f4[:])',
+              'void(f8, f8, f8, f8, f8, b1, f8[:])'],
+             '(),(),(),(),(),()->()')
+def chainPrice(current, volatility, ttm, strike, rf, is_call, out):
+    """Black-Scholes price of a mixed chain of Call and Put options, as a
+    generalized ufunc broadcasting over its inputs (see
+    `blackScholesChainPrice`).
+    """
+
+    out[0] = price(current, volatility, ttm, strike, rf, is_call)
+
+
+@jit
+def impliedVolBisection(option_price: float, current: float, ttm: float,
+                        strike: float, rf: float, is_call: bool, a: float,
+                        b: float, tol: float) -> float:
+    """Implied volatility by bisection, following the same sequence of
+    brackets as `optimization.bisectionSolver` (iteratively).
+
+    Raises:
+        Exception: Raised if no solution is found.
+    """
+
+    while True:
+        # Compute midpoint, and check if estimate is within tolerance
+        mid = (a + b) / 2
+        if (b - a) < tol:
+            return mid
+
+        # Objective at the midpoint and bounds
+        f_mid = option_price - price(current, mid, ttm, strike, rf, is_call)
+        f_a = option_price - price(current, a, ttm, strike, rf, is_call)
+        f_b = option_price - price(current, b, ttm, strike, rf, is_call)
+
+        # Check position of estimate, and move point
+        if (f_a * f_mid) < 0:
+            b = mid
+        elif (f_b * f_mid) < 0:
+            a = mid
+        else:
+            raise Exception('No solution found.')
+
+
+@jit
+def impliedVolNewton(option_price: float, current: float, ttm: float,
+                     strike: float, rf: float, is_call: bool, guess: float,
+                     tol: float, max_iter: int=1000) -> float:
+    """Implied volatility by Newton's method, following the same sequence of
+    iterates as `optimization.newtonSolver` (iteratively).
+
+    `newtonSolver` is recursive, so it is bounded by the interpreter's
+    recursion limit (1000 frames by default, raising a `RecursionError`);
+    the default `max_iter` matches that bound, so both backends give up on
+    the same inputs.
+
+    Raises:
+        Exception: Raised if no solution is found within `max_iter` steps.
+    """
+
+    prev = 0.0
+    x = guess
+
+    for _ in range(max_iter):
+        # Checking if decision variable changed by less than tolerance level
+        if abs(x - prev) < tol:
+            return x
+
+        prev = x
+        x = x - ((price(current, x, ttm, strike, rf, is_call) - option_price)
+                 / vega(current, x, ttm, strike, rf))
+
+    raise Exception('No solution found.')
@@ -1,6 +1,6 @@
+from . import normal
 from .util import computeD1D2
-
-from scipy.stats import norm
+from ..util.config import resolveDtype
 
 import numpy as np
 
@@ -26,7 +26,7 @@ def callDelta(current: float, volatility: float, ttm: float, strike: float,
 
     d1, _ = computeD1D2(current, volatility, ttm, strike, rf)
 
-    return np.exp(-1 * dividend * ttm) * norm.cdf(d1)
+    return np.exp(-1 * dividend * ttm) * normal.cdf(d1)
 
 
 def putDelta(current: float, volatility: float, ttm: float, strike: float,
@@ -50,7 +50,7 @@ def putDelta(current: float, volatility: float, ttm: float, strike: float,
 
     d1, _ = computeD1D2(current, volatility, ttm, strike, rf)
 
-    return -1 * np.exp(-1 * dividend * ttm) * norm.cdf(-1 * d1)
+    return -1 * np.exp(-1 * dividend * ttm) * normal.cdf(-1 * d1)
 
 
 def callGamma(current: float, volatility: float, ttm: float, strike: float,
@@ -71,7 +71,7 @@ def callGamma(current: float, volatility: float, ttm: float, strike: float,
 
     d1, _ = computeD1D2(current, volatility, ttm, strike, rf)
 
-    return (norm.pdf(d1) / (current * volatility * np.sqrt(ttm)))
+    return (normal.pdf(d1) / (current * volatility * np.sqrt(ttm)))
 
 
 def vega(current: float, volatility: float, ttm: float, strike: float,
@@ -91,4 +91,144 @@ def vega(current: float, volatility: float, ttm: float, strike: float,
 
     d1, _ = computeD1D2(current, volatility, ttm, strike, rf)
 
-    return current * np.sqrt(ttm) * norm.pdf(d1)
+    return current * np.sqrt(ttm) * normal.pdf(d1)
+
+
+def allGreeks(current: np.array, volatility: np.array, ttm: np.array,
+              strike: np.array, rf: np.array, dividend: np.array=0,
+              dtype: type=None) -> dict:
+    """Function to compute the Delta, Gamma, Vega, Theta and Rho of both Call
+    and Put options using the Black-Scholes formulas, in a single pass.
+
+    All arguments may be scalars or arrays, and are broadcast against each
+    other. The d1/d2 terms, the normal PDF/CDF values and the discount factors
+    are computed once and shared between all of the Greeks.
+
+    Note that Theta is expressed per year (i.e. divide by the number of days
+    in a year for a daily Theta).
+
+    Arguments:
+        current {np.array} -- Current price of the underlying asset.
+        volatility {np.array} -- Volatility of the underlying asset price.
+        ttm {np.array} -- Time to expiration (in years).
+        strike {np.array} -- Strike price of the option contract.
+        rf {np.array} -- Risk-free rate (annual).
+
+    Keyword Arguments:
+        dividend {np.array} -- Dividend yield (annual) (default: {0}).
+        dtype {type} -- Floating point precision of the computation, or None
+                        to use `cfg.dtype` (default: {None}).
+
+    Returns:
+        dict -- Dictionary of arrays with keys 'call_delta', 'put_delta',
+                'gamma', 'vega', 'call_theta', 'put_theta', 'call_rho' and
+                'put_rho'.
+    """
+
+    # Casting to arrays (at the chosen precision) so that the inputs
+    # broadcast against each other
+    dtype = resolveDtype(dtype)
+    current, volatility, ttm, strike, rf, dividend = [
+        np.asarray(x, dtype=dtype)
+        for x in (current, volatility, ttm, strike, rf, dividend)
+    ]
+
+    # Shared terms
+    d1, d2 = computeD1D2(current, volatility, ttm, strike, rf, dividend)
+    sqrt_ttm = np.sqrt(ttm)
+    div_disc = np.exp(-1 * dividend * ttm)  # Dividend discount factor
+    disc_strike = strike * np.exp(-1 * rf * ttm)  # Discounted strike
+    pdf_d1 = normal.pdf(d1)
+    cdf_d1 = normal.cdf(d1)
+    cdf_d2 = normal.cdf(d2)
+    cdf_neg_d1 = normal.cdf(-1 * d1)
+    cdf_neg_d2 = normal.cdf(-1 * d2)
+
+    # Dividend-discounted underlying price, and its density-weighted value
+    disc_current = current * div_disc
+    disc_current_pdf = disc_current * pdf_d1
+
+    # Theta component common to Calls and Puts (time decay of volatility)
+    theta_vol = -1 * disc_current_pdf * volatility / (2 * sqrt_ttm)
+
+    return {
+        'call_delta': div_disc * cdf_d1,
+        'put_delta': -1 * div_disc * cdf_neg_d1,
+        'gamma': div_disc * pdf_d1 / (current * volatility * sqrt_ttm),
+        'vega': disc_current_pdf * sqrt_ttm,
+        'call_theta': theta_vol - (rf * disc_strike * cdf_d2)
+                      + (dividend * disc_current * cdf_d1),
+        'put_theta': theta_vol + (rf * disc_strike * cdf_neg_d2)
+                     - (dividend * disc_current * cdf_neg_d1),
+        'call_rho': ttm * disc_strike * cdf_d2,
+        'put_rho': -1 * ttm * disc_strike * cdf_neg_d2
+    }
+
+
+def higherOrderGreeks(current: np.array, volatility: np.array, ttm: np.array,
+                      strike: np.array, rf: np.array,
+                      dividend: np.array=0, dtype: type=None) -> dict:
+    """Function to compute the second and third order Greeks (Vanna, Volga,
+    Charm, Zomma, Speed and Color) of both Call and Put options using the
+    Black-Scholes formulas, in a single pass.
+
+    All arguments may be scalars or arrays, and are broadcast against each
+    other. The d1/d2 terms, the normal PDF/CDF values and the discount factors
+    are computed once and shared between all of the Greeks.
+
+    Note that Charm and Color are the time decays of Delta and Gamma
+    respectively (i.e. the negative of the derivative w.r.t. time to
+    expiration, as with Theta), and are expressed per year.
+
+    Arguments:
+        current {np.array} -- Current price of the underlying asset.
+        volatility {np.array} -- Volatility of the underlying asset price.
+        ttm {np.array} -- Time to expiration (in years).
+        strike {np.array} -- Strike price of the option contract.
+        rf {np.array} -- Risk-free rate (annual).
+
+    Keyword Arguments:
+        dividend {np.array} -- Dividend yield (annual) (default: {0}).
+        dtype {type} -- Floating point precision of the computation, or None
+                        to use `cfg.dtype` (default: {None}).
+
+    Returns:
+        dict -- Dictionary of arrays with keys 'vanna', 'volga', 'call_charm',
+                'put_charm', 'zomma', 'speed' and 'color'.
+    """
+
+    # Casting to arrays (at the chosen precision) so that the inputs
+    # broadcast against each other
+    dtype = resolveDtype(dtype)
+    current, volatility, ttm, strike, rf, dividend = [
+        np.asarray(x, dtype=dtype)
+        for x in (current, volatility, ttm, strike, rf, dividend)
+    ]
+
+    # Shared terms
+    d1, d2 = computeD1D2(current, volatility, ttm, strike, rf, dividend)
+    vol_sqrt_ttm = volatility * np.sqrt(ttm)
+    div_disc = np.exp(-1 * dividend * ttm)  # Dividend discount factor
+    pdf_d1 = normal.pdf(d1)
+
+    # Gamma and Vega, from which the higher order Greeks are derived
+    gamma = div_disc * pdf_d1 / (current * vol_sqrt_ttm)
+    vega = current * div_disc * pdf_d1 * np.sqrt(ttm)
+
+    # Derivative of d1 w.r.t. time to expiration
+    d1_ttm = ((2 * (rf - dividend) * ttm) - (d2 * vol_sqrt_ttm)) \
+        / (2 * ttm * vol_sqrt_ttm)
+
+    # Charm component common to Calls and Puts
+    charm_pdf = -1 * div_disc * pdf_d1 * d1_ttm
+
+    return {
+        'vanna': -1 * div_disc * pdf_d1 * d2 / volatility,
+        'volga': vega * d1 * d2 / volatility,
+        'call_charm': charm_pdf + (dividend * div_disc * normal.cdf(d1)),
+        'put_charm': charm_pdf - (dividend * div_disc * normal.cdf(-1 * d1)),
+        'zomma': gamma * ((d1 * d2) - 1) / volatility,
+        'speed': -1 * gamma * ((d1 / vol_sqrt_ttm) + 1) / current,
+        'color': gamma * ((2 * dividend * ttm) + 1
+                          + (2 * ttm * d1 * d1_ttm)) / (2 * ttm)
+    }
@@ -0,0 +1,110 @@
+from ..util.config import resolveDtype
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
+import numpy as np
+import os
+
+
+def evaluateGrid(pricer: Callable, out: np.array=None, chunk_size: int=2**15,
+                 threads: int=None, **kwargs) -> np.array:
+    """Function to evaluate an analytic pricer over a very large scenario grid
+    (e.g. a spot x volatility x ttm x strike stress cube), in cache-sized
+    chunks on a thread pool.
+
+    The pricer arguments are given as keyword arguments, and array arguments
+    are broadcast against each other to form the grid (e.g. by giving each
+    dimension its own axis: `current=spots[:, None, None]`). The broadcast
+    inputs are never materialized; each chunk is evaluated on slices of the
+    broadcast views and written straight into `out`, so peak memory is a few
+    chunks' worth of temporaries on top of the output array itself.
+
+    NumPy and `scipy.special` release the GIL in their array loops, so the
+    chunks are evaluated concurrently on threads. Any pricer in
+    `fe621.black_scholes` that accepts array arguments and returns a single
+    array may be used (e.g. `call`, `put`, `chainPrice`, `asian.call`,
+    `barrier.callUpAndOut`). Scalar and non-numeric keyword arguments
+    (e.g. option type flags) are passed through unchanged.
+
+    Arguments:
+        pricer {Callable} -- Pricing function, called with keyword arguments.
+
+    Keyword Arguments:
+        out {np.array} -- Preallocated output array with the broadcast shape
+                          of the array arguments; allocated at the precision
+                          of the `dtype` argument of the pricer if given, and
+                          `cfg.dtype` otherwise (default: {None}).
+        chunk_size {int} -- Maximum number of grid points evaluated per chunk
+                            (default: {2**15}).
+        threads {int} -- Number of worker threads; defaults to the number of
+                         CPUs (default: {None}).
+        **kwargs -- Arguments passed to `pricer`.
+
+    Raises:
+        ValueError: Raised if `out` does not have the shape of the grid.
+
+    Returns:
+        np.array -- Pricer output over the full grid (i.e. `out`).
+    """
+
+    # Separating array arguments (grid dimensions) from pass-through arguments
+    array_kwargs = {k: np.asarray(v) for k, v in kwargs.items()
+                    if isinstance(v, (np.ndarray, list, tuple))}
+    fixed_kwargs = {k: v for k, v in kwargs.items() if k not in array_kwargs}
+
+    # Broadcasting array arguments to the grid shape (as views; no copies)
+    shape = np.broadcast_shapes(*[v.shape for v in array_kwargs.values()])
+    grid_kwargs = {k: np.broadcast_to(v, shape)
+                   for k, v in array_kwargs.items()}
+
+    # Allocating output if required, and checking shape otherwise
+    if out is None:
+        out = np.empty(shape, dtype=resolveDtype(fixed_kwargs.get('dtype')))
+    elif out.shape != shape:
+        raise ValueError('`out` must have the grid shape {0}.'.format(shape))
+
+    # Defining chunk evaluation function
+    def evaluateChunk(index: tuple):
+        chunk_kwargs = {k: v[index] for k, v in grid_kwargs.items()}
+        out[index] = pricer(**chunk_kwargs, **fixed_kwargs)
+
+    # Evaluating chunks on the thread pool
+    with ThreadPoolExecutor(max_workers=threads or os.cpu_count()) as pool:
+        # Consuming the iterator so that worker exceptions are raised here
+        for _ in pool.map(evaluateChunk, _chunkIndexes(shape, chunk_size)):
+            pass
+
+    return out
+
+
+def _chunkIndexes(shape: tuple, chunk_size: int) -> Iterator[tuple]:
+    """Helper function to split a grid into chunks of at most `chunk_size`
+    points, by slicing along the leading axes. Yields tuples of slices, each
+    indexing a contiguous block of the grid.
+
+    Arguments:
+        shape {tuple} -- Shape of the grid.
+        chunk_size {int} -- Maximum number of points per chunk.
+
+    Returns:
+        Iterator[tuple] -- Iterator of tuples of slices (one per chunk).
+    """
+
+    # Zero-dimensional grid; single chunk
+    if len(shape) == 0:
+        yield ()
+        return
+
+    # Number of points spanned by a single index along the leading axis
+    inner_size = int(np.prod(shape[1:]))
+
+    if inner_size <= chunk_size:
+        # Taking as many leading-axis rows as fit in one chunk
+        rows = max(1, chunk_size // max(inner_size, 1))
+        for start in range(0, shape[0], rows):
+            yield (slice(start, min(start + rows, shape[0])),)
+    else:
+        # Leading axis row is too large; split each row along the next axis
+        for i in range(shape[0]):
+            for inner_index in _chunkIndexes(shape[1:], chunk_size):
+                yield (slice(i, i + 1),) + inner_index
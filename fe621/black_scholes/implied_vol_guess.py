@@ -0,0 +1,59 @@
+import math
+import numpy as np
+
+
+def impliedVolGuess(price: np.array, current: np.array, ttm: np.array,
+                    strike: np.array, rf: np.array, is_call: np.array,
+                    dividend: np.array=0, upper: float=5.0) -> np.array:
+    """Function to compute a closed-form approximation of the implied
+    volatility of a European Call or Put option, to be used as the initial
+    guess of an iterative implied volatility solver.
+
+    This is the Corrado-Miller (1996) quadratic approximation, which reduces
+    to the Brenner-Subrahmanyam (1988) approximation for at-the-money
+    (forward) options. Put prices are converted to Call prices by put-call
+    parity. When the discriminant of the approximation is negative (e.g. far
+    from the money), it is floored at zero. All arguments may be scalars or
+    arrays, and are broadcast against each other.
+
+    Arguments:
+        price {np.array} -- Market price of the option contract.
+        current {np.array} -- Current price of the underlying asset.
+        ttm {np.array} -- Time to expiration (in years).
+        strike {np.array} -- Strike price of the option contract.
+        rf {np.array} -- Risk-free rate (annual).
+        is_call {np.array} -- Boolean flag(s); True for Call options, False for
+                              Put options.
+
+    Keyword Arguments:
+        dividend {np.array} -- Dividend yield (annual) (default: {0}).
+        upper {float} -- Upper bound of the volatility; the approximation is
+                         clipped to (0, upper] (default: {5.0}).
+
+    Returns:
+        np.array -- Approximate implied volatility.
+    """
+
+    # Casting to arrays so that the inputs broadcast against each other
+    price, current, ttm, strike, rf, dividend = [
+        np.asarray(x, dtype=float)
+        for x in (price, current, ttm, strike, rf, dividend)
+    ]
+
+    # Discounted underlying price and strike
+    disc_current = current * np.exp(-1 * dividend * ttm)
+    disc_strike = strike * np.exp(-1 * rf * ttm)
+    moneyness = disc_current - disc_strike
+
+    # Equivalent Call price, by put-call parity
+    call = np.where(is_call, price, price + moneyness)
+
+    # Corrado-Miller approximation (with the discriminant floored at zero)
+    excess = call - (moneyness / 2)
+    discriminant = np.maximum(np.power(excess, 2)
+                              - (np.power(moneyness, 2) / math.pi), 0)
+    guess = math.sqrt(2 * math.pi) * (excess + np.sqrt(discriminant)) \
+        / ((disc_current + disc_strike) * np.sqrt(ttm))
+
+    # Keeping the estimate strictly inside the solver bracket
+    return np.clip(guess, 1e-4, upper)
@@ -1,6 +1,6 @@
+from . import normal
 from .util import computeD1D2
 
-from scipy.stats import norm
 import numpy as np
 
 
@@ -23,7 +23,7 @@ def blackScholesPut(current: float, volatility: float, ttm: float,
 
     d1, d2 = computeD1D2(current, volatility, ttm, strike, rf)
 
-    put = (strike * np.exp(-1 * rf * ttm) * norm.cdf(-1 * d2)) \
-        - (current * norm.cdf(-1 * d1))
+    put = (strike * np.exp(-1 * rf * ttm) * normal.cdf(-1 * d2)) \
+        - (current * normal.cdf(-1 * d1))
     
     return put
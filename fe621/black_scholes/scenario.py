@@ -0,0 +1,115 @@
+from .chain import blackScholesChainPrice
+from ..util import option_metadata
+from ..util.config import cfg, resolveDtype
+
+import numpy as np
+
+
+# Floor applied to shocked volatilities and rolled ttms, keeping the pricing
+# formula finite (expired contracts are replaced by their intrinsic value)
+_floor = 1e-12
+
+
+class ScenarioGrid():
+    """Scenario risk grid for a book of European options on a single
+    underlying asset, priced with the Black-Scholes formula.
+
+    The book is described by OCC-style contract names (parsed with
+    `util.option_metadata`), position quantities and implied volatilities. The
+    whole book is revalued under a lattice of spot shocks, volatility shocks
+    and time rolls in a single broadcast evaluation, and the profit and loss
+    (P&L) relative to the current value of the book is returned.
+    """
+
+    def __init__(self, names: list, quantities: np.array,
+                 implied_vols: np.array, current: float, rf: float,
+                 current_date: str, dtype: type=None):
+        """Initialization method for the `ScenarioGrid` class.
+
+        Arguments:
+            names {list} -- Names of the option contracts in the book.
+            quantities {np.array} -- Position quantity of each contract
+                                     (negative for short positions).
+            implied_vols {np.array} -- Implied volatility of each contract.
+            current {float} -- Current price of the underlying asset.
+            rf {float} -- Risk-free rate (annual).
+            current_date {str} -- Current date in the form: YYYY-MM-DD.
+
+        Keyword Arguments:
+            dtype {type} -- Floating point precision of the scenario
+                            revaluation, or None to use `cfg.dtype`
+                            (default: {None}).
+        """
+
+        self.names = list(names)
+        self.dtype = resolveDtype(dtype)
+        self.quantities = np.asarray(quantities, dtype=self.dtype)
+        self.implied_vols = np.asarray(implied_vols, dtype=self.dtype)
+        self.current = current
+        self.rf = rf
+
+        # Parsing contract metadata once for the whole book
+        contracts = option_metadata.parseContracts(names=self.names,
+                                                   current_date=current_date)
+        self.is_call = contracts['is_call'].values
+        self.strike = contracts['strike'].values.astype(self.dtype)
+        self.ttm = contracts['ttm'].values.astype(self.dtype)
+
+        # Current value of each position (base for P&L)
+        self.base_value = self.quantities * blackScholesChainPrice(
+            current=self.current, volatility=self.implied_vols, ttm=self.ttm,
+            strike=self.strike, rf=self.rf, is_call=self.is_call,
+            dtype=self.dtype)
+
+    def pnl(self, spot_shocks: np.array, vol_shocks: np.array,
+            time_rolls: np.array, by_contract: bool=False) -> np.array:
+        """Function to compute the P&L of the book over the scenario lattice.
+
+        Spot shocks are relative (e.g. -0.1 for a 10% drop in the underlying
+        price), volatility shocks are absolute (e.g. 0.05 adds 5 volatility
+        points to every implied volatility) and time rolls are in days.
+        Contracts that expire within a time roll are valued at their intrinsic
+        value.
+
+        Arguments:
+            spot_shocks {np.array} -- Relative shocks to the underlying price.
+            vol_shocks {np.array} -- Absolute shocks to implied volatility.
+            time_rolls {np.array} -- Time rolls (in days).
+
+        Keyword Arguments:
+            by_contract {bool} -- Flag to return the P&L of each contract on a
+                                  trailing axis, instead of the book total
+                                  (default: {False}).
+
+        Returns:
+            np.array -- P&L tensor with shape (spot, vol, time), or
+                        (spot, vol, time, contract) if `by_contract` is set.
+        """
+
+        # Laying out scenario dimensions on separate axes, contracts last
+        spot = self.current * (1 + np.asarray(spot_shocks, dtype=self.dtype))
+        spot = spot[:, None, None, None]
+        vol = self.implied_vols \
+            + np.asarray(vol_shocks, dtype=self.dtype)[:, None]
+        vol = np.maximum(vol, _floor)[None, :, None, :]
+        ttm = self.ttm - (np.asarray(time_rolls, dtype=self.dtype)[:, None]
+                          / cfg.days_in_year)
+        expired = (ttm <= 0)[None, None, :, :]
+        ttm = np.maximum(ttm, _floor)[None, None, :, :]
+
+        # Revaluing the book in a single broadcast evaluation
+        value = blackScholesChainPrice(current=spot, volatility=vol, ttm=ttm,
+                                       strike=self.strike, rf=self.rf,
+                                       is_call=self.is_call, dtype=self.dtype)
+
+        # Intrinsic value for contracts expiring within the time roll
+        if expired.any():
+            intrinsic = np.where(self.is_call,
+                                 np.maximum(spot - self.strike, 0),
+                                 np.maximum(self.strike - spot, 0))
+            value = np.where(expired, intrinsic, value)
+
+        # P&L of each position
+        pnl = (self.quantities * value) - self.base_value
+
+        return pnl if by_contract else pnl.sum(axis=-1)
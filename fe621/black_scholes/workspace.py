@@ -0,0 +1,39 @@
+from ..util.config import resolveDtype
+
+import numpy as np
+
+
+class ChainWorkspace():
+    """Reusable scratch buffers for repricing an option chain of fixed shape.
+
+    Allocating this once per chain, and passing it to
+    `blackScholesChainInto` on every repricing call (e.g. once per minute bar)
+    means that the steady-state pricing loop performs no array allocations.
+    """
+
+    def __init__(self, shape: tuple, dtype: type=None):
+        """Initialization method for the `ChainWorkspace` class.
+
+        Arguments:
+            shape {tuple} -- Shape of the chain (i.e. the broadcast shape of
+                             the pricing inputs). An int is accepted for a
+                             one-dimensional chain.
+
+        Keyword Arguments:
+            dtype {type} -- Floating point precision of the buffers, or None
+                            to use `cfg.dtype` (default: {None}).
+        """
+
+        self.shape = (shape,) if np.isscalar(shape) else tuple(shape)
+        self.dtype = resolveDtype(dtype)
+
+        # Intermediate terms of the Black-Scholes formula
+        self.d1 = np.empty(self.shape, dtype=self.dtype)
+        self.d2 = np.empty(self.shape, dtype=self.dtype)
+        self.vol_sqrt_ttm = np.empty(self.shape, dtype=self.dtype)
+        self.disc_strike = np.empty(self.shape, dtype=self.dtype)
+        self.scratch = np.empty(self.shape, dtype=self.dtype)
+
+        # Default output buffers
+        self.call = np.empty(self.shape, dtype=self.dtype)
+        self.put = np.empty(self.shape, dtype=self.dtype)
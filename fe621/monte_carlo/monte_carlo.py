@@ -1,10 +1,18 @@
+from ..util.config import resolveDtype
+
 from scipy.stats import norm
 from typing import Callable
 import numpy as np
 
 
+# Generator for single precision normals when none is given (the global NumPy
+# random state only draws in double precision)
+_rng = np.random.default_rng()
+
+
 def monteCarloSkeleton(sim_count: int, eval_count: int, sim_func: Callable,
-    sim_dimensionality: int=1, sim_func_kwargs: dict=None) -> np.array:
+    sim_dimensionality: int=1, sim_func_kwargs: dict=None,
+    dtype: type=None, rng: np.random.Generator=None) -> np.array:
     """Function to run a simple Monte Carlo simulation. This is a highly
     generalized Monte Carlo simulation skeleton, and takes in functions as
     parameters for computation functions, and final post-processing
@@ -23,11 +31,28 @@ def monteCarloSkeleton(sim_count: int, eval_count: int, sim_func: Callable,
                                     the shape of random normals (default: {1}).
         sim_func_kwargs {dict} -- Optional additional keyword arguments for the
                                   simulation function (default: {None}).
+        dtype {type} -- Floating point precision of the random normals, or
+                        None to use `cfg.dtype` (default: {None}).
+        rng {np.random.Generator} -- Generator of the random normals, drawn
+                                     natively at `dtype`. If None, double
+                                     precision normals are drawn from the
+                                     global NumPy random state (so that
+                                     `np.random.seed` applies), and single
+                                     precision normals from a module-level
+                                     generator (default: {None}).
     
     Returns:
         np.array -- Array of simulated value outputs.
     """
-    
+
+    # Random normal generator, at the required precision
+    dtype = resolveDtype(dtype)
+    if (rng is None) and (dtype == np.float64):
+        draw = lambda size: norm.rvs(size=size)
+    else:
+        rng = _rng if rng is None else rng
+        draw = lambda size: rng.standard_normal(size=size, dtype=dtype)
+
     # Simulation function
     def simulation() -> float:
         """Single simulation run. This is written as a separate function so I
@@ -36,7 +61,7 @@ def monteCarloSkeleton(sim_count: int, eval_count: int, sim_func: Callable,
         """
 
         # Building list of normal random numbers to apply to sim_func
-        rand_Ns = norm.rvs(size=(sim_dimensionality, eval_count))
+        rand_Ns = draw(size=(sim_dimensionality, eval_count))
         
         # Applying simulated function over path (pass kwargs if applicable)
         if sim_func_kwargs:
@@ -1,2 +1,6 @@
 from .bisection import bisectionSolver
+from .brent import brentSolver
 from .newton import newtonSolver
+from .result import SolverResult
+from .vector import vectorBisectionSolver, vectorBrentSolver
+from .vector import vectorNewtonSolver
@@ -1,5 +1,4 @@
 from typing import Callable
-import numpy as np
 
 
 def bisectionSolver(f: Callable, a: float, b: float,
@@ -33,9 +32,9 @@ def bisectionSolver(f: Callable, a: float, b: float,
 
     # Check position of estimate, move point and re-evaluate
     if (f(a) * f_mid) < 0:
-        return bisectionSolver(f=f, a=a, b=mid)
+        return bisectionSolver(f=f, a=a, b=mid, tol=tol)
     elif (f(b) * f_mid) < 0:
-        return bisectionSolver(f=f, a=mid, b=b)
+        return bisectionSolver(f=f, a=mid, b=b, tol=tol)
     else:
         raise Exception("No solution found.")
 
@@ -0,0 +1,146 @@
+from .result import SolverResult
+
+from typing import Callable, Tuple
+import numpy as np
+
+
+def brentSolver(f: Callable, a: float, b: float, tol: float=10e-6,
+                max_iter: int=100, max_eval: int=None, max_expand: int=0,
+                expand_factor: float=1.6,
+                limits: Tuple[float, float]=(-np.inf, np.inf)) \
+                -> SolverResult:
+    """Brent's method root finder, implemented iteratively.
+
+    Combines inverse quadratic interpolation and secant steps with bisection,
+    keeping a bracket of the root at every iteration, so that it converges
+    superlinearly on smooth functions while never doing worse than
+    bisection. Each iteration makes a single function evaluation, which makes
+    it suitable for expensive objectives (e.g. tree or Monte Carlo pricers).
+
+    If `f(a)` and `f(b)` have the same sign, the bracket can be expanded
+    geometrically (up to `max_expand` times), moving the end with the smaller
+    absolute function value outwards, without leaving `limits`.
+
+    Arguments:
+        f {Callable} -- Function to be solved.
+        a {float} -- Lower bound.
+        b {float} -- Upper bound.
+
+    Keyword Arguments:
+        tol {float} -- Solution tolerance (default: {10e-6}).
+        max_iter {int} -- Maximum number of iterations (default: {100}).
+        max_eval {int} -- Maximum number of function evaluations, including
+                          the evaluations of the bracket; unlimited if None
+                          (default: {None}).
+        max_expand {int} -- Maximum number of bracket expansions
+                            (default: {0}).
+        expand_factor {float} -- Bracket expansion factor (default: {1.6}).
+        limits {Tuple[float, float]} -- Limits of the bracket expansion
+                                        (default: {(-np.inf, np.inf)}).
+
+    Returns:
+        SolverResult -- Solution, with the number of iterations and function
+                        evaluations, and the convergence status.
+    """
+
+    # Budget of function evaluations
+    if max_eval is None:
+        max_eval = np.inf
+
+    # Evaluating the bracket
+    fa = f(a)
+    fb = f(b)
+    evaluations = 2
+
+    # Expanding the bracket until the function changes sign
+    expansions = 0
+    while (fa * fb) > 0:
+        # Checking the expansion and evaluation budgets
+        if (expansions >= max_expand) or (evaluations >= max_eval):
+            return SolverResult(root=b, status='no_bracket', iterations=0,
+                                evaluations=evaluations, bracket=(a, b))
+
+        # Moving the end with the smaller function value (unless at a limit)
+        expand_a = (np.abs(fa) < np.abs(fb)) or (b >= limits[1])
+        if expand_a and (a > limits[0]):
+            a = max(a + (expand_factor * (a - b)), limits[0])
+            fa = f(a)
+        elif b < limits[1]:
+            b = min(b + (expand_factor * (b - a)), limits[1])
+            fb = f(b)
+        else:
+            return SolverResult(root=b, status='no_bracket', iterations=0,
+                                evaluations=evaluations, bracket=(a, b))
+
+        evaluations += 1
+        expansions += 1
+
+    # Contrapoint c, with f(b) and f(c) of opposite signs
+    c, fc = a, fa
+    d = e = b - a
+
+    for iteration in range(1, max_iter + 2):
+        # Restoring the contrapoint if b and c are on the same side
+        if (fb * fc) > 0:
+            c, fc = a, fa
+            d = e = b - a
+
+        # Keeping b as the best estimate
+        if np.abs(fc) < np.abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        # Checking if the estimate is within tolerance
+        tol1 = (2 * np.finfo(float).eps * np.abs(b)) + (tol / 2)
+        mid = (c - b) / 2
+        if (np.abs(mid) <= tol1) or (fb == 0):
+            return SolverResult(root=b, status='converged',
+                                iterations=iteration - 1,
+                                evaluations=evaluations,
+                                bracket=(min(b, c), max(b, c)))
+
+        # Checking the iteration and evaluation budgets
+        if iteration > max_iter:
+            return SolverResult(root=b, status='max_iter',
+                                iterations=max_iter,
+                                evaluations=evaluations,
+                                bracket=(min(b, c), max(b, c)))
+        if evaluations >= max_eval:
+            return SolverResult(root=b, status='max_eval',
+                                iterations=iteration - 1,
+                                evaluations=evaluations,
+                                bracket=(min(b, c), max(b, c)))
+
+        if (np.abs(e) >= tol1) and (np.abs(fa) > np.abs(fb)):
+            # Interpolation step; secant if a == c, inverse quadratic otherwise
+            s = fb / fa
+            if a == c:
+                p = 2 * mid * s
+                q = 1 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * ((2 * mid * q * (q - r)) - ((b - a) * (r - 1)))
+                q = (q - 1) * (r - 1) * (s - 1)
+
+            if p > 0:
+                q = -1 * q
+            p = np.abs(p)
+
+            # Accepting the interpolation only if it falls well within the
+            # bracket and converges fast enough, bisecting otherwise
+            if (2 * p) < min((3 * mid * q) - np.abs(tol1 * q),
+                             np.abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = mid
+        else:
+            # Bisection step
+            d = e = mid
+
+        # Moving the estimate (by at least the tolerance)
+        a, fa = b, fb
+        b = b + (d if np.abs(d) > tol1 else np.copysign(tol1, mid))
+        fb = f(b)
+        evaluations += 1
@@ -0,0 +1,42 @@
+class SolverResult():
+    """Result of an iterative root finder, reporting the solution along with
+    the work done to find it and the convergence status.
+
+    The status is one of 'converged' (solution within tolerance),
+    'max_iter' (iteration budget exhausted), 'max_eval' (function evaluation
+    budget exhausted), 'no_bracket' (no sign change found in the bracket) or
+    'diverged' (non-finite step). The batched solvers (see `optimization.
+    vector`) report every field as an array, with one element per equation.
+    """
+
+    def __init__(self, root: float, status: str, iterations: int,
+                 evaluations: int, bracket: tuple):
+        """Initialization method for the `SolverResult` class.
+
+        Arguments:
+            root {float} -- Solution estimate (best estimate if the solver did
+                            not converge).
+            status {str} -- Convergence status.
+            iterations {int} -- Number of iterations.
+            evaluations {int} -- Number of function evaluations.
+            bracket {tuple} -- Final bracket (a, b) of the solution.
+        """
+
+        self.root = root
+        self.status = status
+        self.iterations = iterations
+        self.evaluations = evaluations
+        self.bracket = bracket
+
+    @property
+    def converged(self) -> bool:
+        """True if the solver converged to within tolerance (element-wise for
+        batched results).
+        """
+
+        return self.status == 'converged'
+
+    def __repr__(self) -> str:
+        return ('SolverResult(root={0}, status={1!r}, iterations={2}, '
+                'evaluations={3})').format(self.root, self.status,
+                                           self.iterations, self.evaluations)
@@ -0,0 +1,291 @@
+from .result import SolverResult
+
+from typing import Callable
+import numpy as np
+
+
+# Batched root finders, solving many independent scalar equations at once.
+# The objective is called as `f(x, index)`, and must return the value of the
+# equations with (flat) indices `index` at the points `x` (arrays of the same
+# length). Elements are dropped from `index` as they finish, so that only the
+# elements still being solved are evaluated.
+
+
+def vectorBisectionSolver(f: Callable, a: np.array, b: np.array,
+                          tol: float=10e-6, max_iter: int=100) \
+                          -> SolverResult:
+    """Bisection method solver for a batch of independent equations.
+
+    Arguments:
+        f {Callable} -- Batched function to be solved (see module notes).
+        a {np.array} -- Lower bound of each element.
+        b {np.array} -- Upper bound of each element.
+
+    Keyword Arguments:
+        tol {float} -- Solution tolerance (default: {10e-6}).
+        max_iter {int} -- Maximum number of iterations (default: {100}).
+
+    Returns:
+        SolverResult -- Per-element solutions, statuses, iteration and
+                        evaluation counts, and final brackets (arrays with the
+                        broadcast shape of `a` and `b`).
+    """
+
+    a, b = [np.array(x, dtype=float) for x in np.broadcast_arrays(a, b)]
+    result = _initialResult(shape=a.shape, evaluations=2)
+    a, b = a.ravel(), b.ravel()
+
+    # Evaluating the brackets, and discarding those without a sign change
+    index = np.arange(a.size)
+    fa = f(a, index)
+    fb = f(b, index)
+    keep = fa * fb <= 0
+    _record(result, index, ~keep, 'no_bracket', b, 0, 2, a, b)
+    index, a, b, fa = [arr[keep] for arr in (index, a, b, fa)]
+
+    for iteration in range(1, max_iter + 1):
+        if index.size == 0:
+            break
+
+        # Evaluating the midpoint, and moving the bracket end with the same
+        # sign as the midpoint
+        mid = (a + b) / 2
+        f_mid = f(mid, index)
+        lower = np.sign(f_mid) == np.sign(fa)
+        a = np.where(lower, mid, a)
+        fa = np.where(lower, f_mid, fa)
+        b = np.where(lower, b, mid)
+
+        # Checking if the estimates are within tolerance
+        done = ((b - a) < tol) | (f_mid == 0)
+        _record(result, index, done, 'converged', (a + b) / 2, iteration,
+                iteration + 2, a, b)
+
+        index, a, b, fa = [arr[~done] for arr in (index, a, b, fa)]
+
+    # Unfinished elements
+    _record(result, index, np.ones(index.shape, dtype=bool), 'max_iter',
+            (a + b) / 2, max_iter, max_iter + 2, a, b)
+
+    return result
+
+
+def vectorNewtonSolver(f: Callable, f_prime: Callable, guess: np.array,
+                       a: np.array=None, b: np.array=None, tol: float=10e-6,
+                       max_iter: int=100) -> SolverResult:
+    """Newton method solver for a batch of independent equations.
+
+    If a bracket [a, b] of the roots is given, the iteration is safeguarded;
+    the bracket of each element is shrunk at every iteration, and any Newton
+    step that leaves it (or is not finite) is replaced by a bisection step.
+    The side of the root is given by the signs of the function and its
+    derivative, so the function must be monotonic on the bracket. Without a
+    bracket, elements with a non-finite step are marked as 'diverged'.
+
+    Arguments:
+        f {Callable} -- Batched function to be solved (see module notes).
+        f_prime {Callable} -- Batched first derivative of `f`, or None if `f`
+                              returns a tuple with the function value and its
+                              derivative (e.g. to share intermediate terms).
+        guess {np.array} -- Initial guess of each element.
+
+    Keyword Arguments:
+        a {np.array} -- Lower bound of each element (default: {None}).
+        b {np.array} -- Upper bound of each element (default: {None}).
+        tol {float} -- Tolerance level (default: {10e-6}).
+        max_iter {int} -- Maximum number of iterations (default: {100}).
+
+    Returns:
+        SolverResult -- Per-element solutions, statuses, iteration and
+                        evaluation counts, and final brackets (arrays with the
+                        shape of `guess`).
+    """
+
+    x = np.array(guess, dtype=float)
+    result = _initialResult(shape=x.shape, evaluations=0)
+    x = x.ravel()
+    index = np.arange(x.size)
+
+    # Safeguarding bracket (unbounded if not given)
+    safe = (a is not None) and (b is not None)
+    lo = np.broadcast_to(-np.inf if a is None else a, x.shape).astype(float)
+    hi = np.broadcast_to(np.inf if b is None else b, x.shape).astype(float)
+
+    iteration = 0
+    for iteration in range(1, max_iter + 1):
+        if index.size == 0:
+            break
+
+        # Objective and derivative at the current estimates
+        if f_prime is None:
+            fx, dfx = f(x, index)
+        else:
+            fx, dfx = f(x, index), f_prime(x, index)
+
+        # Newton step, and checking if it is within tolerance level
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = x - (fx / dfx)
+        done = (np.abs(step - x) < tol) | (fx == 0)
+
+        if safe:
+            # Shrinking the bracket, and bisecting outside of it (unless
+            # converged, as the final step may land on the bracket)
+            slope = fx * dfx
+            np.copyto(hi, x, where=slope > 0)
+            np.copyto(lo, x, where=slope < 0)
+            bisect = ~(((step > lo) & (step < hi)) | done)
+            step[bisect] = (lo[bisect] + hi[bisect]) / 2
+            keep = ~done
+        else:
+            # Stopping elements with a non-finite step
+            diverged = ~np.isfinite(step)
+            _record(result, index, diverged, 'diverged', x, iteration,
+                    iteration, lo, hi)
+            step[diverged] = x[diverged]
+            keep = ~(done | diverged)
+
+        x = step
+        _record(result, index, done, 'converged', x, iteration, iteration, lo,
+                hi)
+
+        index, x, lo, hi = [arr[keep] for arr in (index, x, lo, hi)]
+
+    # Unfinished elements
+    _record(result, index, np.ones(index.shape, dtype=bool), 'max_iter', x,
+            iteration, iteration, lo, hi)
+
+    return result
+
+
+def vectorBrentSolver(f: Callable, a: np.array, b: np.array,
+                      tol: float=10e-6, max_iter: int=100) -> SolverResult:
+    """Brent's method solver for a batch of independent equations, following
+    the same iterates as `brentSolver` for each element.
+
+    Arguments:
+        f {Callable} -- Batched function to be solved (see module notes).
+        a {np.array} -- Lower bound of each element.
+        b {np.array} -- Upper bound of each element.
+
+    Keyword Arguments:
+        tol {float} -- Solution tolerance (default: {10e-6}).
+        max_iter {int} -- Maximum number of iterations (default: {100}).
+
+    Returns:
+        SolverResult -- Per-element solutions, statuses, iteration and
+                        evaluation counts, and final brackets (arrays with the
+                        broadcast shape of `a` and `b`).
+    """
+
+    a, b = [np.array(x, dtype=float) for x in np.broadcast_arrays(a, b)]
+    result = _initialResult(shape=a.shape, evaluations=2)
+    a, b = a.ravel(), b.ravel()
+
+    # Evaluating the brackets, and discarding those without a sign change
+    index = np.arange(a.size)
+    fa = f(a, index)
+    fb = f(b, index)
+    keep = fa * fb <= 0
+    _record(result, index, ~keep, 'no_bracket', b, 0, 2, a, b)
+    index, a, b, fa, fb = [arr[keep] for arr in (index, a, b, fa, fb)]
+
+    # Contrapoint c, with f(b) and f(c) of opposite signs
+    c, fc = a.copy(), fa.copy()
+    d = e = b - a
+
+    for iteration in range(1, max_iter + 2):
+        if index.size == 0:
+            break
+
+        # Restoring the contrapoint if b and c are on the same side
+        same = (fb * fc) > 0
+        c, fc = np.where(same, a, c), np.where(same, fa, fc)
+        d, e = np.where(same, b - a, d), np.where(same, b - a, e)
+
+        # Keeping b as the best estimate
+        swap = np.abs(fc) < np.abs(fb)
+        a, fa = np.where(swap, b, a), np.where(swap, fb, fa)
+        b, fb = np.where(swap, c, b), np.where(swap, fc, fb)
+        c, fc = np.where(swap, a, c), np.where(swap, fa, fc)
+
+        # Checking if the estimates are within tolerance
+        tol1 = (2 * np.finfo(float).eps * np.abs(b)) + (tol / 2)
+        mid = (c - b) / 2
+        done = (np.abs(mid) <= tol1) | (fb == 0)
+        _record(result, index, done, 'converged', b, iteration - 1,
+                iteration + 1, np.minimum(b, c), np.maximum(b, c))
+
+        # Stopping the remaining elements at the iteration budget
+        if iteration > max_iter:
+            _record(result, index, ~done, 'max_iter', b, max_iter,
+                    iteration + 1, np.minimum(b, c), np.maximum(b, c))
+            done = np.ones(index.shape, dtype=bool)
+
+        # Dropping finished elements
+        keep = ~done
+        index, a, b, c, fa, fb, fc, d, e, tol1, mid = [
+            arr[keep] for arr in (index, a, b, c, fa, fb, fc, d, e, tol1, mid)
+        ]
+        if index.size == 0:
+            break
+
+        # Interpolation step; secant if a == c, inverse quadratic otherwise
+        with np.errstate(divide='ignore', invalid='ignore'):
+            s = fb / fa
+            q_ = fa / fc
+            r = fb / fc
+            secant = a == c
+            p = np.where(secant, 2 * mid * s,
+                         s * ((2 * mid * q_ * (q_ - r))
+                              - ((b - a) * (r - 1))))
+            q = np.where(secant, 1 - s, (q_ - 1) * (r - 1) * (s - 1))
+        q = np.where(p > 0, -1 * q, q)
+        p = np.abs(p)
+
+        # Accepting the interpolation only if it falls well within the
+        # bracket and converges fast enough, bisecting otherwise
+        interpolate = (np.abs(e) >= tol1) & (np.abs(fa) > np.abs(fb)) \
+            & ((2 * p) < np.minimum((3 * mid * q) - np.abs(tol1 * q),
+                                    np.abs(e * q)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            e = np.where(interpolate, d, mid)
+            d = np.where(interpolate, p / q, mid)
+
+        # Moving the estimates (by at least the tolerance)
+        a, fa = b, fb
+        b = b + np.where(np.abs(d) > tol1, d, np.copysign(tol1, mid))
+        fb = f(b, index)
+
+    return result
+
+
+def _initialResult(shape: tuple, evaluations: int) -> SolverResult:
+    """Helper function to build an empty batched result, with every element
+    at the 'max_iter' status (i.e. unfinished).
+    """
+
+    return SolverResult(root=np.full(shape, np.nan),
+                        status=np.full(shape, 'max_iter', dtype='<U10'),
+                        iterations=np.zeros(shape, dtype=int),
+                        evaluations=np.full(shape, evaluations),
+                        bracket=(np.full(shape, np.nan),
+                                 np.full(shape, np.nan)))
+
+
+def _record(result: SolverResult, index: np.array, mask: np.array,
+            status: str, root: np.array, iterations: int, evaluations: int,
+            lo: np.array, hi: np.array):
+    """Helper function to store the final state of the finished elements
+    `index[mask]` in a batched result.
+    """
+
+    finished = index[mask]
+    if finished.size == 0:
+        return
+
+    result.status.ravel()[finished] = status
+    result.root.ravel()[finished] = root[mask]
+    result.iterations.ravel()[finished] = iterations
+    result.evaluations.ravel()[finished] = evaluations
+    result.bracket[0].ravel()[finished] = lo[mask]
+    result.bracket[1].ravel()[finished] = hi[mask]
@@ -12,7 +12,8 @@ class Barrier(GeneralTree):
 
     def __init__(self, current: float, strike: float, ttm: float, rf: float,
                  volatility: float, barrier: float, barrier_type: str,
-                 opt_type: str, opt_style: str, steps: int=1):
+                 opt_type: str, opt_style: str, steps: int=1,
+                 dtype: type=None):
         """Initialization method for the `Barrier` class.
         
         Arguments:
@@ -28,6 +29,8 @@ class Barrier(GeneralTree):
         
         Keyword Arguments:
             steps {int} -- Number of steps to construct (default: {1}).
+            dtype {type} -- Floating point precision of the trees, or None to
+                            use `cfg.dtype` (default: {None}).
         """
 
         # Ensuring valid option type and style
@@ -84,13 +87,14 @@ class Barrier(GeneralTree):
         self.disc = np.exp(-1 * rf * deltaT)
 
         # Initializing GeneralTree, with root set to ln price for Trigeorgis
-        super().__init__(price_tree_root=np.log(current), steps=steps)
+        super().__init__(price_tree_root=np.log(current), steps=steps,
+                         dtype=dtype)
 
         if (barrier_type == 'I'):
             # Special case for 'In' barrier type
             vanilla_tree = Trigeorgis(current=current, strike=strike, ttm=ttm,
                 rf=rf, volatility=volatility, opt_type=opt_type,
-                opt_style=opt_style, steps=steps)
+                opt_style=opt_style, steps=steps, dtype=dtype)
             self.value_tree = (vanilla_tree.value_tree - self.value_tree)\
                 .todok(copy=True)
     
@@ -157,9 +161,8 @@ class Barrier(GeneralTree):
             np.array -- Value of the option corresponding to the input prices.
         """
 
-        # Computing prices of each of the values
-        underlying_prices = np.array([0 if i == 0 else np.exp(i)
-                                        for i in last_col])
+        # Computing prices of each of the values (zero nodes stay at zero)
+        underlying_prices = np.where(last_col == 0, 0, np.exp(last_col))
 
         # Computing barrier indicator function values for last_col values
         indicator_val = np.array([[self.barrierIndicator(i)]
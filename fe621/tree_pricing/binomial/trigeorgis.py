@@ -12,7 +12,7 @@ class Trigeorgis(GeneralTree):
 
     def __init__(self, current: float, strike: float, ttm: float, rf: float,
                  volatility: float, opt_type: str, opt_style: str,
-                 steps: int=1):
+                 steps: int=1, dtype: type=None):
         """Initialization method for the `Trigeorgis` class.
         
         Arguments:
@@ -26,6 +26,8 @@ class Trigeorgis(GeneralTree):
         
         Keyword Arguments:
             steps {int} -- Number of steps to construct (default: {1}).
+            dtype {type} -- Floating point precision of the trees, or None to
+                            use `cfg.dtype` (default: {None}).
         """
 
         # Ensuring valid option type and style
@@ -62,7 +64,8 @@ class Trigeorgis(GeneralTree):
         self.disc = np.exp(-1 * rf * deltaT)
 
         # Initializing GeneralTree, with root set to log price for Trigeorgis
-        super().__init__(price_tree_root=np.log(current), steps=steps)
+        super().__init__(price_tree_root=np.log(current), steps=steps,
+                         dtype=dtype)
 
     def childrenPrice(self) -> np.array:
         """Function to compute the price of children nodes, given the price at
@@ -110,6 +113,27 @@ class Trigeorgis(GeneralTree):
         
         return child_implied_value
 
+    def latticeParameters(self) -> dict:
+        """Function to get the parameters of the tree for the compiled tree
+        construction kernels. See `GeneralTree.latticeParameters` for more.
+
+        Returns:
+            dict -- Dictionary of tree parameters.
+        """
+
+        return {
+            'delta_up': self.deltaXU,
+            'delta_down': self.deltaXD,
+            'trinomial': False,
+            'disc': self.disc,
+            'jump_up': self.jumpU,
+            'jump_mid': 0.0,
+            'jump_down': self.jumpD,
+            'strike': self.strike,
+            'is_call': self.opt_type == 'C',
+            'american': self.opt_style == 'A'
+        }
+
     def valueFromLastCol(self, last_col: np.array) -> np.array:
         """Function to compute the option value of the last column (i.e. last
         row of leaf nodes) of the price tree.
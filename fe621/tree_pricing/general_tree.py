@@ -1,3 +1,7 @@
+from . import lattice
+from ..util.backend import useNumba
+from ..util.config import resolveDtype
+
 from abc import ABC, abstractmethod
 from scipy import sparse
 import numpy as np
@@ -35,7 +39,8 @@ class GeneralTree(ABC):
 
     # Need to add documentation to this; explain persistent variables, etc.
     def __init__(self, price_tree_root: float, steps: int=1,
-                 build_price_tree: bool=True, build_value_tree: bool=True):
+                 build_price_tree: bool=True, build_value_tree: bool=True,
+                 dtype: type=None):
         """Initialization method for the abstract `GeneralTree` class.
         
         Constructs both the price and value tree, and isolates the instrument
@@ -53,6 +58,9 @@ class GeneralTree(ABC):
             steps {int} -- Number of steps to construct (default: {1}).
             build_price_tree {bool} -- Price tree flag (default: {True}).
             build_value_tree {bool} -- Value tree flag (default: {True}).
+            dtype {type} -- Floating point precision of the price and value
+                            trees, or None to use `cfg.dtype`
+                            (default: {None}).
         
         Raises:
             ValueError -- Raised when the number of steps is invalid.
@@ -63,6 +71,7 @@ class GeneralTree(ABC):
 
         self.price_tree_root = price_tree_root
         self.steps = steps
+        self.dtype = resolveDtype(dtype)
 
         # Check steps
         if self.steps < 1:
@@ -158,6 +167,24 @@ class GeneralTree(ABC):
         """
 
         raise NotImplementedError
+
+    def latticeParameters(self) -> dict:
+        """Function to get the parameters of the tree for the compiled tree
+        construction kernels (see `tree_pricing.lattice`), used when the numba
+        backend is enabled.
+
+        Trees with constant additive jumps, constant jump probabilities and a
+        vanilla Call or Put payoff may override this function to return a
+        dictionary with keys 'delta_up', 'delta_down', 'trinomial', 'disc',
+        'jump_up', 'jump_mid', 'jump_down', 'strike', 'is_call' and
+        'american'. By default, None is returned, and the tree is always
+        constructed with the node-by-node algorithm.
+
+        Returns:
+            dict -- Dictionary of tree parameters, or None.
+        """
+
+        return None
     
     def getPriceTree(self) -> np.array:
         """Get the constructed price tree.
@@ -244,11 +271,27 @@ class GeneralTree(ABC):
                                  price tree.
         """
 
+        # Index of the middle row (i.e. the root) of the tree
+        self.mid_row_index = self.nrow // 2
+
+        # Compiled construction, if enabled and supported by the tree
+        params = self.latticeParameters()
+        if (params is not None) and useNumba():
+            price_tree = np.zeros((self.nrow, self.ncolumn), dtype=self.dtype)
+            lattice.priceTree(price_tree=price_tree,
+                              root=self.price_tree_root, steps=self.steps,
+                              delta_up=params['delta_up'],
+                              delta_down=params['delta_down'],
+                              trinomial=params['trinomial'])
+            # NOTE: Converting through COO, as building a DOK matrix directly
+            #       from a dense matrix is slow on some versions of scipy
+            return sparse.coo_matrix(price_tree).todok()
+
         # Instantiate sparse matrix with correct size and type
-        price_tree = sparse.dok_matrix((self.nrow, self.ncolumn), dtype=float)
+        price_tree = sparse.dok_matrix((self.nrow, self.ncolumn),
+                                       dtype=self.dtype)
 
         # Setting root of tree to given value
-        self.mid_row_index = np.floor(self.nrow / 2)
         price_tree[self.mid_row_index, 0] = self.price_tree_root
 
         # Iterate over columns
@@ -318,8 +361,26 @@ class GeneralTree(ABC):
                                  dimensions as `self.price_tree`.
         """
 
+        # Compiled construction, if enabled and supported by the tree
+        params = self.latticeParameters()
+        if (params is not None) and useNumba():
+            price_tree = self.price_tree.toarray()
+            value_tree = np.zeros((self.nrow, self.ncolumn), dtype=self.dtype)
+            value_tree[:, self.ncolumn - 1] = np.ravel(self.valueFromLastCol(
+                last_col=price_tree[:, self.ncolumn - 1:]))
+            lattice.valueTree(value_tree=value_tree, price_tree=price_tree,
+                              steps=self.steps, disc=params['disc'],
+                              jump_up=params['jump_up'],
+                              jump_mid=params['jump_mid'],
+                              jump_down=params['jump_down'],
+                              strike=params['strike'],
+                              is_call=params['is_call'],
+                              american=params['american'])
+            return sparse.coo_matrix(value_tree).todok()
+
         # Creating copy of price tree for the value tree
-        value_tree = sparse.dok_matrix((self.nrow, self.ncolumn), dtype=float)
+        value_tree = sparse.dok_matrix((self.nrow, self.ncolumn),
+                                       dtype=self.dtype)
 
         # Applying value function to the last column of child price nodes
         last_row = self.valueFromLastCol(
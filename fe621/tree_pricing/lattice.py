@@ -0,0 +1,87 @@
+from ..util.backend import jit
+
+import math
+import numpy as np
+
+
+# Compiled tree construction kernels, used in place of the node-by-node
+# `GeneralTree` algorithm when the numba backend is enabled (see
+# `util.backend`), for trees that define `GeneralTree.latticeParameters`. The
+# kernels visit and write the nodes of the dense matrix representation of the
+# tree in the same order as the `GeneralTree` algorithm.
+
+
+@jit
+def priceTree(price_tree: np.array, root: float, steps: int, delta_up: float,
+              delta_down: float, trinomial: bool):
+    """Function to fill the (dense, zero-initialized) price tree matrix of an
+    additive tree, in place.
+
+    Arguments:
+        price_tree {np.array} -- Matrix of shape ((2 * steps) + 1, steps + 1).
+        root {float} -- Value of the root of the price tree.
+        steps {int} -- Number of steps of the tree.
+        delta_up {float} -- Additive upward jump.
+        delta_down {float} -- Additive downward jump.
+        trinomial {bool} -- Flag for trinomial trees; the middle child takes
+                            the value of its parent (and 0 for binomial trees).
+    """
+
+    price_tree[steps, 0] = root
+
+    for j in range(0, steps):
+        for i in range(steps - j, steps + j + 1):
+            # Skip zero (i.e. empty) nodes
+            current = price_tree[i, j]
+            if current == 0:
+                continue
+
+            price_tree[i - 1, j + 1] = current + delta_up
+            price_tree[i, j + 1] = current if trinomial else 0
+            price_tree[i + 1, j + 1] = current + delta_down
+
+
+@jit
+def valueTree(value_tree: np.array, price_tree: np.array, steps: int,
+              disc: float, jump_up: float, jump_mid: float, jump_down: float,
+              strike: float, is_call: bool, american: bool):
+    """Function to fill the (dense) value tree matrix of a vanilla option by
+    backward induction, in place. The last column of `value_tree` must already
+    hold the option values at expiration.
+
+    Arguments:
+        value_tree {np.array} -- Value tree, with the last column filled.
+        price_tree {np.array} -- Dense log-price tree.
+        steps {int} -- Number of steps of the tree.
+        disc {float} -- Discount factor for each step.
+        jump_up {float} -- Upward jump probability.
+        jump_mid {float} -- Middle jump probability (0 for binomial trees).
+        jump_down {float} -- Downward jump probability.
+        strike {float} -- Strike price of the option.
+        is_call {bool} -- True for Call options, False for Put options.
+        american {bool} -- True for American options, False for European.
+    """
+
+    for j in range(steps - 1, -1, -1):
+        for i in range(steps - j, steps + j + 1):
+            # Skip zero (i.e. empty) nodes
+            current = price_tree[i, j]
+            if current == 0:
+                continue
+
+            # Value implied by children
+            value = disc * ((jump_up * value_tree[i - 1, j + 1])
+                            + (jump_mid * value_tree[i, j + 1])
+                            + (jump_down * value_tree[i + 1, j + 1]))
+
+            # Early exercise of American options
+            if american:
+                if is_call:
+                    exercise = math.exp(current) - strike
+                else:
+                    exercise = strike - math.exp(current)
+
+                if exercise > value:
+                    value = exercise
+
+            value_tree[i, j] = value
@@ -12,7 +12,7 @@ class TrinomialAdditivePriceTree(GeneralTree):
 
     def __init__(self, current: float, strike: float, ttm: float, rf: float,
                  volatility: float, opt_type: str, opt_style: str,
-                 dividend: float=0, steps: int=1):
+                 dividend: float=0, steps: int=1, dtype: type=None):
         """Initialization method for the `TrinomialAdditivePriceTree` class.
         
         Arguments:
@@ -27,6 +27,8 @@ class TrinomialAdditivePriceTree(GeneralTree):
         Keyword Arguments:
             dividend {float} -- Cont. div. yield (annualized) (default: {0}).
             steps {int} -- Number of steps to construct (default: {1}).
+            dtype {type} -- Floating point precision of the trees, or None to
+                            use `cfg.dtype` (default: {None}).
         """
 
         # Ensuring valid option type and style
@@ -63,7 +65,8 @@ class TrinomialAdditivePriceTree(GeneralTree):
         self.disc = np.exp(-1 * rf * deltaT)
 
         # Initializing GeneralTree, with root set to log price for Additive tree
-        super().__init__(price_tree_root=np.log(current), steps=steps)
+        super().__init__(price_tree_root=np.log(current), steps=steps,
+                         dtype=dtype)
 
     def childrenPrice(self) -> np.array:
         """Function to compute the price of children nodes, given the price at
@@ -112,6 +115,27 @@ class TrinomialAdditivePriceTree(GeneralTree):
         
         return child_implied_value
 
+    def latticeParameters(self) -> dict:
+        """Function to get the parameters of the tree for the compiled tree
+        construction kernels. See `GeneralTree.latticeParameters` for more.
+
+        Returns:
+            dict -- Dictionary of tree parameters.
+        """
+
+        return {
+            'delta_up': self.deltaXU,
+            'delta_down': self.deltaXD,
+            'trinomial': True,
+            'disc': self.disc,
+            'jump_up': self.jumpU,
+            'jump_mid': self.jumpM,
+            'jump_down': self.jumpD,
+            'strike': self.strike,
+            'is_call': self.opt_type == 'C',
+            'american': self.opt_style == 'A'
+        }
+
     def valueFromLastCol(self, last_col: np.array) -> np.array:
         """Function to compute the option value of the last column (i.e. last
         row of leaf nodes) of the price tree.
@@ -1,8 +1,17 @@
-from .config import cfg
+from .backend import HAS_NUMBA, useNumba
+from .config import cfg, resolveDtype
 from .data_loading import loadData
 from .data_rename import renameOptionFiles
 from .implied_vol import computeAvgImpliedVolBisection, computeAvgImpliedVolNewton
+from .implied_vol import computeAvgImpliedVolSequential
+from .implied_vol import computeImpliedVolMatrix
+from .implied_vol_stream import ImpliedVolStream
+from .memoize import PricerCache, dedupeEvaluate, memoize
 from .option_metadata import *
+from .vol_surface import VolSurface
 
 __all__ = ['cfg', 'computeAvgImpliedVolBisection', 'computeAvgImpliedVolNewton',
-           'loadData', 'renameOptionFiles']
+           'computeAvgImpliedVolSequential', 'computeImpliedVolMatrix',
+           'dedupeEvaluate', 'HAS_NUMBA', 'ImpliedVolStream', 'loadData',
+           'memoize', 'PricerCache', 'renameOptionFiles', 'resolveDtype',
+           'useNumba', 'VolSurface']
@@ -0,0 +1,78 @@
+from .config import cfg
+
+from typing import Callable
+
+# numba is an optional dependency; the compiled kernels are only used if it is
+# installed, and the pure NumPy implementations are used otherwise
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+
+
+def useNumba() -> bool:
+    """Function to determine whether the numba-compiled kernels should be
+    used, according to the `cfg.backend` setting ('auto', 'numba' or 'numpy')
+    and the availability of numba.
+
+    Raises:
+        ValueError: Raised if `cfg.backend` is invalid.
+        ImportError: Raised if `cfg.backend` is 'numba', and numba is not
+                     installed.
+
+    Returns:
+        bool -- True if the compiled kernels should be used.
+    """
+
+    # Verify backend choice
+    if cfg.backend not in ['auto', 'numba', 'numpy']:
+        raise ValueError('`cfg.backend` must be \'auto\', \'numba\' or '
+                         '\'numpy\'.')
+
+    if cfg.backend == 'numba' and not HAS_NUMBA:
+        raise ImportError('The numba backend requires numba to be installed.')
+
+    return HAS_NUMBA and (cfg.backend != 'numpy')
+
+
+def jit(func: Callable) -> Callable:
+    """Decorator to compile a function in nopython mode with numba, if it is
+    installed. The function is returned unchanged otherwise. NumPy semantics
+    are used for floating point errors (e.g. division by zero returns inf,
+    as with the NumPy implementations, instead of raising).
+
+    Arguments:
+        func {Callable} -- Function to be compiled.
+
+    Returns:
+        Callable -- Compiled function (or `func` itself).
+    """
+
+    if not HAS_NUMBA:
+        return func
+
+    return numba.njit(cache=True, error_model='numpy')(func)
+
+
+def guvectorize(signatures: list, layout: str) -> Callable:
+    """Decorator factory to compile a function into a generalized NumPy
+    ufunc with numba (i.e. with broadcasting and multiple outputs), if it is
+    installed. The function is returned unchanged otherwise.
+
+    Arguments:
+        signatures {list} -- numba type signatures of the function.
+        layout {str} -- Generalized ufunc layout (e.g. '(),()->()').
+
+    Returns:
+        Callable -- Decorator compiling the function (or returning it as is).
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if not HAS_NUMBA:
+            return func
+
+        return numba.guvectorize(signatures, layout, cache=True)(func)
+
+    return decorator
@@ -1,6 +1,35 @@
+import numpy as np
+
+
 class cfg():
     """Class to store configuration variables.
     """
 
     # Days in a year (used for black scholes computation)
     days_in_year = 365
+
+    # Floating point precision of the vectorized Black-Scholes kernels, Monte
+    # Carlo random numbers and tree storage. Setting this to np.float32 halves
+    # the memory footprint of large scenario grids and simulations, at the
+    # cost of accuracy. Implied volatility solvers always use float64.
+    dtype = np.float64
+
+    # Compute backend of the pricing and solver kernels; 'auto' uses the
+    # numba-compiled kernels if numba is installed (see `util.backend`), and
+    # 'numpy' forces the pure NumPy implementations
+    backend = 'auto'
+
+
+def resolveDtype(dtype: type=None) -> np.dtype:
+    """Function to resolve the floating point precision of a computation;
+    the given precision if set, and the global `cfg.dtype` otherwise.
+
+    Keyword Arguments:
+        dtype {type} -- Floating point type (e.g. np.float32), or None to use
+                        `cfg.dtype` (default: {None}).
+
+    Returns:
+        np.dtype -- Resolved floating point precision.
+    """
+
+    return np.dtype(cfg.dtype if dtype is None else dtype)
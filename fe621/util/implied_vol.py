@@ -1,13 +1,20 @@
 from . import option_metadata
+from .backend import useNumba
+from .memoize import memoize
 from .. import black_scholes
-from ..optimization import bisectionSolver, newtonSolver
+from ..optimization import bisectionSolver, brentSolver, newtonSolver
 
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Tuple
+import functools
 import numpy as np
 import pandas as pd
 
 
 def computeAvgImpliedVolBisection(data: pd.DataFrame, name: str, rf: float,
-                                current_date: str, tol: float) -> pd.DataFrame:
+                                current_date: str, tol: float,
+                                cache_size: int=0,
+                                processes: int=1) -> pd.DataFrame:
     """Function to compute the average implied volatility of a series of Option
     contracts, in the form created by the `util.loadData` function.
 
@@ -18,131 +25,189 @@ def computeAvgImpliedVolBisection(data: pd.DataFrame, name: str, rf: float,
         current_date {str} -- Current date (of data) in the form: YYYY-MM-DD.
         tol {float} -- Tolerance level of the estimate.
 
+    Keyword Arguments:
+        cache_size {int} -- Size of the per-contract LRU cache of solutions,
+                            keyed on the (underlying price, option price)
+                            pair. Repeated pairs (e.g. forward-filled stale
+                            bars) are then solved only once. Disabled if 0
+                            (default: {0}).
+        processes {int} -- Number of worker processes the contracts are
+                           sharded across; solved serially if 1 (default: {1}).
+
     Returns:
         pd.DataFrame -- DataFrame with columns of option metadata, and
                         corresponding implied volatilities.
     """
 
-    # Empty dictionary for implied volatility estimates
-    estimates = dict()
-
-    for column in data:
-        # Skip underlying prices column
-        if column == name:
-            continue
-
-        # Computing ttm, strike, and type
-        is_call = option_metadata.isCallOption(name=column)
-        ttm = option_metadata.getTTM(name=column, current_date=current_date)
-        strike = option_metadata.getStrikePrice(name=column)
+    return _computeAvgImpliedVol(data=data, name=name,
+                                 worker=_contractAvgImpliedVol,
+                                 processes=processes,
+                                 solver=_solveImpliedVolBisection, rf=rf,
+                                 current_date=current_date, tol=tol,
+                                 cache_size=cache_size)
 
-        # Empty array to store computed implied volatilities
-        imp_vols = np.array([])
 
-        for index, price in data[column].iteritems():
-            # Defining function to be optimized
-            def optimFunc(x: float) -> float:
-                # Assigning price computation function based on type
-                if is_call:
-                    f = black_scholes.call
-                else:
-                    f = black_scholes.put
+def computeAvgImpliedVolNewton(data: pd.DataFrame, name: str, rf: float,
+                               current_date: str, tol: float,
+                               cache_size: int=0,
+                               processes: int=1) -> pd.DataFrame:
+    """Function to compute the average implied volatility of a series of
+    Option contracts, in the form created by the `util.loadData` function.
 
-                # Returning computed option price less actual price
-                return price - f(current=data[name][index], volatility=x,
-                                 ttm=ttm, strike=strike, rf=rf)
+    Arguments:
+        data {pd.DataFrame} -- Price data in the form output by `util.loadData`.
+        name {str} -- Name of the underlying asset (ticker).
+        rf {float} -- Risk-free rate.
+        current_date {str} -- Current date (of data) in the form: YYYY-MM-DD.
+        tol {float} -- Tolerance level of the estimate.
 
-            # Computing implied volatility for each price
-            try:
-                imp_vol = bisectionSolver(f=optimFunc, a=0.0, b=5.0, tol=tol)
-            except Exception:
-                print('WARNING: No implied vol solution found for {0} at {1}'
-                      .format(column, index))
-                continue
+    Keyword Arguments:
+        cache_size {int} -- Size of the per-contract LRU cache of solutions,
+                            keyed on the (underlying price, option price)
+                            pair. Repeated pairs (e.g. forward-filled stale
+                            bars) are then solved only once. Disabled if 0
+                            (default: {0}).
+        processes {int} -- Number of worker processes the contracts are
+                           sharded across; solved serially if 1 (default: {1}).
 
-            # Appending to array
-            imp_vols = np.append(imp_vols, imp_vol)
+    Returns:
+        pd.DataFrame -- DataFrame with columns of option metadata, and
+                        corresponding implied volatilities.
+    """
 
-            print('option', column, 'time', index, 'imp_vol', imp_vol)
+    return _computeAvgImpliedVol(data=data, name=name,
+                                 worker=_contractAvgImpliedVol,
+                                 processes=processes,
+                                 solver=_solveImpliedVolNewton, rf=rf,
+                                 current_date=current_date, tol=tol,
+                                 cache_size=cache_size)
 
-        # Computing mean implied volatility for option, adding to estimates
-        estimates[column] = [np.mean(imp_vols)]
 
-    # Cast to DataFrame, clean and return
-    return cleanImpliedVol(candidate_df=pd.DataFrame(estimates))
+def computeAvgImpliedVolSequential(data: pd.DataFrame, name: str, rf: float,
+                                   current_date: str, tol: float,
+                                   width: float=0.01,
+                                   processes: int=1) -> pd.DataFrame:
+    """Function to compute the average implied volatility of a series of
+    Option contracts, in the form created by the `util.loadData` function,
+    warm-starting the solve of each bar from the previous one.
 
+    Implied volatility barely moves between consecutive minute bars, so each
+    bar is solved with Brent's method in a tight bracket around the solution
+    of the previous bar, falling back to the full bracket [0, 5] if the
+    solution is not in the tight bracket (or for the first bar).
 
-def computeAvgImpliedVolNewton(data: pd.DataFrame, name: str, rf: float,
-                               current_date: str, tol: float) -> pd.DataFrame:
-    """Function to compute the average implied volatility of a series of
-    Option contracts, in the form created by the `util.loadData` function.
-    
     Arguments:
         data {pd.DataFrame} -- Price data in the form output by `util.loadData`.
         name {str} -- Name of the underlying asset (ticker).
         rf {float} -- Risk-free rate.
         current_date {str} -- Current date (of data) in the form: YYYY-MM-DD.
         tol {float} -- Tolerance level of the estimate.
-    
+
+    Keyword Arguments:
+        width {float} -- Half-width of the bracket around the previous
+                         solution (default: {0.01}).
+        processes {int} -- Number of worker processes the contracts are
+                           sharded across; solved serially if 1 (default: {1}).
+
     Returns:
         pd.DataFrame -- DataFrame with columns of option metadata, and
                         corresponding implied volatilities.
     """
 
-    # Empty dictionary for implied volatility estimates
-    estimates = dict()
+    return _computeAvgImpliedVol(data=data, name=name,
+                                 worker=_contractAvgImpliedVolSequential,
+                                 processes=processes, rf=rf,
+                                 current_date=current_date, tol=tol,
+                                 width=width)
 
-    for column in data:
-        # Skip underlying prices column
-        if column == name:
-            continue
-        
-        # Computing ttm, strike, and type
-        is_call = option_metadata.isCallOption(name=column)
-        ttm = option_metadata.getTTM(name=column, current_date=current_date)
-        strike = option_metadata.getStrikePrice(name=column)
-
-        # Empty array to store computed implied volatilities
-        imp_vols = np.array([])
-
-        for index, price in data[column].iteritems():
-            # Defining function to be optimized
-            def optimFunc(x: float) -> float:
-                # Assigning price computation function based on type
-                if is_call:
-                    f = black_scholes.call
-                else:
-                    f = black_scholes.put
-                
-                # Returning computed option price less actual price
-                return f(current=data[name][index], volatility=x, ttm=ttm,
-                         strike=strike, rf=rf) - price
-            
-            # Defining derivative of optimization function
-            def optimFuncDerivative(x: float) -> float:
-                return black_scholes.greeks.vega(current=data[name][index],
-                                                 volatility=x,
-                                                 ttm=ttm, strike=strike, rf=rf)
-        
-            # Computing implied volatility for each price
-            try:
-                imp_vol = newtonSolver(f=optimFunc, f_prime=optimFuncDerivative,
-                                       guess=5, tol=tol)
-            except Exception:
-                print('WARNING: No implied vol solution found for {0} at {1}'
-                    .format(column, index))
-                continue
-            
-            # Appending to array
-            imp_vols = np.append(imp_vols, imp_vol)
-
-            print('option', column, 'time', index, 'imp_vol', imp_vol)
-
-        # Computing mean implied volatility for option, adding to estimates
-        estimates[column] = [np.mean(imp_vols)]
-    
-    # Cast to DataFrame, clean and return
-    return cleanImpliedVol(candidate_df=pd.DataFrame(estimates))
+
+def computeImpliedVolMatrix(data: pd.DataFrame, name: str, rf: float,
+                            current_date: str, tol: float,
+                            max_iter: int=100) -> Tuple[pd.DataFrame,
+                                                        pd.DataFrame]:
+    """Function to compute the implied volatility of every price of a series
+    of Option contracts at once, in the form created by the `util.loadData`
+    function.
+
+    The whole (minute bars x contracts) price matrix is solved in a single
+    vectorized pass over Calls and Puts (see `ChainContext.impliedVol`),
+    instead of one scalar solve per price.
+
+    Arguments:
+        data {pd.DataFrame} -- Price data in the form output by `util.loadData`.
+        name {str} -- Name of the underlying asset (ticker).
+        rf {float} -- Risk-free rate.
+        current_date {str} -- Current date (of data) in the form: YYYY-MM-DD.
+        tol {float} -- Tolerance level of the estimate.
+
+    Keyword Arguments:
+        max_iter {int} -- Maximum number of solver iterations
+                          (default: {100}).
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame] -- Tuple with the matrix of implied
+                                             volatilities (with the index and
+                                             option columns of `data`, and NaN
+                                             where no solution is found), and
+                                             the daily aggregates; a DataFrame
+                                             in the form output by
+                                             `cleanImpliedVol`, with the
+                                             standard deviation and number of
+                                             implied volatilities added.
+    """
+
+    # Option contracts (i.e. every column but the underlying prices)
+    names = [column for column in data if column != name]
+
+    # Invariant inputs of the chain, computed once
+    context = black_scholes.ChainContext(names=names, rf=rf,
+                                         current_date=current_date)
+
+    # Solving the full matrix, with underlying prices as a column
+    imp_vols = context.impliedVol(current=data[[name]].values,
+                                  price=data[names].values, tol=tol,
+                                  max_iter=max_iter)
+    imp_vols = pd.DataFrame(imp_vols, index=data.index, columns=names)
+
+    # Aggregating over the day, with option metadata
+    summary = chainSummary(context=context, aggregates={
+        'implied_vol': imp_vols.mean().values,
+        'implied_vol_std': imp_vols.std().values,
+        'count': imp_vols.count().values
+    })
+
+    return (imp_vols, summary)
+
+
+def chainSummary(context: 'black_scholes.ChainContext',
+                 aggregates: dict) -> pd.DataFrame:
+    """Function to format per-contract implied volatility aggregates of a
+    chain in the form output by `cleanImpliedVol`, with the option metadata
+    in individual columns.
+
+    Arguments:
+        context {black_scholes.ChainContext} -- Context of the chain.
+        aggregates {dict} -- Dictionary of aggregate name to array of values,
+                             in the order of the contracts of the chain.
+
+    Returns:
+        pd.DataFrame -- Formatted DataFrame, sorted by expiration, then by
+                        strike price and type.
+    """
+
+    summary = pd.DataFrame({
+        'name': context.names,
+        'expiration': [option_metadata.getExpiration(name=option_name)
+                       .strftime('%Y-%m-%d') for option_name in context.names],
+        'type': np.where(context.is_call, 'C', 'P'),
+        'strike': context.strike,
+        **aggregates
+    })
+
+    # Sorting by expiration, then by strike price
+    summary.sort_values(by=['expiration', 'strike', 'type'], inplace=True)
+
+    return summary
 
 
 def cleanImpliedVol(candidate_df: pd.DataFrame) -> pd.DataFrame:
@@ -158,35 +223,246 @@ def cleanImpliedVol(candidate_df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame -- Formatted DataFrame.
     """
 
-    # Transposing and removing top (empty) row
-    candidate_df = candidate_df.T[1:]
-
-    # Creating empty dataframe to store formatted output
-    clean_df = pd.DataFrame()
-
-    # Iterating through transformed DataFrame, isolating option metadata
-    for option_name, implied_vol in candidate_df.iterrows():
-        # Extracting implied vol; it is the only element in the series
-        implied_vol = implied_vol[0]
+    # Rows of formatted output, one per option
+    rows = []
 
+    # Iterating through the (single row of) estimates, isolating metadata
+    for option_name, implied_vol in candidate_df.iloc[0].items():
         # Extracting option metadata
         option_expiry = option_metadata.getExpiration(name=option_name) \
                         .strftime('%Y-%m-%d')
-        
+
         # Extracting option type
-        option_type = 'C' if option_metadata.isCallOption(name=option_name) else 'P'
-        
+        option_type = 'C' if option_metadata.isCallOption(name=option_name) \
+                      else 'P'
+
         # Extracting option strike
         option_strike = option_metadata.getStrikePrice(name=option_name)
 
-        # Appending to new DataFrame
-        clean_df = clean_df.append(pd.Series([option_name, option_expiry,
-                                              option_type, option_strike,
-                                              implied_vol]), ignore_index=True)
+        # Appending to rows
+        rows.append([option_name, option_expiry, option_type, option_strike,
+                     implied_vol])
 
-    clean_df.columns = ['name', 'expiration', 'type', 'strike', 'implied_vol']
+    # Casting to DataFrame
+    clean_df = pd.DataFrame(rows, columns=['name', 'expiration', 'type',
+                                           'strike', 'implied_vol'])
 
     # Sorting by expiration, then by strike price
     clean_df.sort_values(by=['expiration', 'strike', 'type'], inplace=True)
 
     return clean_df
+
+
+def _computeAvgImpliedVol(data: pd.DataFrame, name: str, worker: Callable,
+                          processes: int, **kwargs) -> pd.DataFrame:
+    """Helper function to compute the average implied volatility of every
+    contract with a per-contract `worker` (called with the option and
+    underlying prices, and `kwargs`), serially or sharded across a pool of
+    `processes` worker processes, and to merge the results.
+
+    Contracts are independent, so each shard is solved on its own core. The
+    worker and its arguments are pickled to the worker processes, so they must
+    be defined at module level (i.e. not nested closures). Under the 'spawn'
+    start method (e.g. Windows, macOS), workers re-import `fe621` and do not
+    see runtime changes to `util.cfg` (e.g. the compute backend).
+    """
+
+    # Option contracts (i.e. every column but the underlying prices)
+    columns = [column for column in data if column != name]
+
+    # Per-contract solver, with the shared arguments bound
+    solveContract = functools.partial(worker, current=data[name], **kwargs)
+    prices = (data[column] for column in columns)
+
+    if processes > 1:
+        # Sharding the contracts across the pool, a few shards per process
+        # so that the load stays balanced (contracts differ in cost)
+        chunksize = max(len(columns) // (4 * processes), 1)
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            imp_vols = list(pool.map(solveContract, prices,
+                                     chunksize=chunksize))
+    else:
+        imp_vols = [solveContract(option_prices) for option_prices in prices]
+
+    # Merging mean implied volatilities (in the order of the contracts)
+    estimates = {column: [imp_vol]
+                 for column, imp_vol in zip(columns, imp_vols)}
+
+    # Cast to DataFrame, clean and return
+    return cleanImpliedVol(candidate_df=pd.DataFrame(estimates))
+
+
+def _contractAvgImpliedVol(prices: pd.Series, current: pd.Series,
+                           solver: Callable, rf: float, current_date: str,
+                           tol: float, cache_size: int) -> float:
+    """Helper function to compute the average implied volatility of a single
+    Option contract (named after `prices`), solving each price independently
+    with `solver` (see `_solveImpliedVolBisection`).
+    """
+
+    column = prices.name
+
+    # Computing ttm, strike, and type
+    is_call = option_metadata.isCallOption(name=column)
+    ttm = option_metadata.getTTM(name=column, current_date=current_date)
+    strike = option_metadata.getStrikePrice(name=column)
+
+    # Implied volatility solver for a single price
+    solveImpliedVol = functools.partial(solver, ttm=ttm, strike=strike, rf=rf,
+                                        is_call=is_call, tol=tol)
+
+    # Caching solutions for repeated inputs, if enabled
+    if cache_size > 0:
+        solveImpliedVol = memoize(func=solveImpliedVol, maxsize=cache_size)
+
+    # Empty array to store computed implied volatilities
+    imp_vols = np.array([])
+
+    for index, price in prices.items():
+        # Computing implied volatility for each price
+        try:
+            imp_vol = solveImpliedVol(current[index], price)
+        except Exception:
+            print('WARNING: No implied vol solution found for {0} at {1}'
+                  .format(column, index))
+            continue
+
+        # Appending to array
+        imp_vols = np.append(imp_vols, imp_vol)
+
+        print('option', column, 'time', index, 'imp_vol', imp_vol)
+
+    # Computing mean implied volatility for option
+    return np.mean(imp_vols)
+
+
+def _contractAvgImpliedVolSequential(prices: pd.Series, current: pd.Series,
+                                     rf: float, current_date: str, tol: float,
+                                     width: float) -> float:
+    """Helper function to compute the average implied volatility of a single
+    Option contract (named after `prices`), warm-starting each bar from the
+    previous one (see `computeAvgImpliedVolSequential`).
+    """
+
+    column = prices.name
+
+    # Computing ttm, strike, and type
+    is_call = option_metadata.isCallOption(name=column)
+    ttm = option_metadata.getTTM(name=column, current_date=current_date)
+    strike = option_metadata.getStrikePrice(name=column)
+
+    # Assigning price computation function based on type
+    if is_call:
+        f = black_scholes.call
+    else:
+        f = black_scholes.put
+
+    # Empty list to store computed implied volatilities, and solution of the
+    # previous bar (None if not available)
+    imp_vols = []
+    prev = None
+
+    for index, price in prices.items():
+        # Defining function to be solved
+        optimFunc = functools.partial(_priceError, f=f, current=current[index],
+                                      ttm=ttm, strike=strike, rf=rf,
+                                      price=price)
+
+        # Tight bracket around the previous solution
+        result = None
+        if prev is not None:
+            result = brentSolver(f=optimFunc, a=max(prev - width, 0.0),
+                                 b=min(prev + width, 5.0), tol=tol)
+
+        # Full bracket, for the first bar or if the tight bracket failed
+        if (result is None) or (not result.converged):
+            result = brentSolver(f=optimFunc, a=0.0, b=5.0, tol=tol)
+
+        if not result.converged:
+            print('WARNING: No implied vol solution found for {0} at {1}'
+                  .format(column, index))
+            prev = None
+            continue
+
+        # Appending to list, and warm-starting the next bar
+        prev = result.root
+        imp_vols.append(prev)
+
+        print('option', column, 'time', index, 'imp_vol', prev)
+
+    # Computing mean implied volatility for option
+    return np.mean(imp_vols)
+
+
+def _solveImpliedVolBisection(current: float, price: float, ttm: float,
+                              strike: float, rf: float, is_call: bool,
+                              tol: float) -> float:
+    """Helper function to solve the implied volatility of a single price with
+    the bisection method, in the [0, 5] bracket.
+    """
+
+    # Compiled solver, if the numba backend is enabled
+    if useNumba():
+        return black_scholes.compiled.impliedVolBisection(
+            price, current, ttm, strike, rf, is_call, 0.0, 5.0, tol)
+
+    # Assigning price computation function based on type
+    if is_call:
+        f = black_scholes.call
+    else:
+        f = black_scholes.put
+
+    # Defining function to be optimized (actual price less computed price)
+    def optimFunc(x: float) -> float:
+        return -1 * _priceError(x, f=f, current=current, ttm=ttm,
+                                strike=strike, rf=rf, price=price)
+
+    return bisectionSolver(f=optimFunc, a=0.0, b=5.0, tol=tol)
+
+
+def _solveImpliedVolNewton(current: float, price: float, ttm: float,
+                           strike: float, rf: float, is_call: bool,
+                           tol: float) -> float:
+    """Helper function to solve the implied volatility of a single price with
+    the Newton method, from the closed-form initial estimate (see
+    `black_scholes.impliedVolGuess`).
+    """
+
+    # Closed-form initial estimate
+    guess = float(black_scholes.impliedVolGuess(
+        price=price, current=current, ttm=ttm, strike=strike, rf=rf,
+        is_call=is_call))
+
+    # Compiled solver, if the numba backend is enabled
+    if useNumba():
+        return black_scholes.compiled.impliedVolNewton(
+            price, current, ttm, strike, rf, is_call, guess, tol)
+
+    # Assigning price computation function based on type
+    if is_call:
+        f = black_scholes.call
+    else:
+        f = black_scholes.put
+
+    # Defining function to be optimized
+    def optimFunc(x: float) -> float:
+        return _priceError(x, f=f, current=current, ttm=ttm, strike=strike,
+                           rf=rf, price=price)
+
+    # Defining derivative of optimization function
+    def optimFuncDerivative(x: float) -> float:
+        return black_scholes.greeks.vega(current=current, volatility=x,
+                                         ttm=ttm, strike=strike, rf=rf)
+
+    return newtonSolver(f=optimFunc, f_prime=optimFuncDerivative, guess=guess,
+                        tol=tol)
+
+
+def _priceError(x: float, f: Callable, current: float, ttm: float,
+                strike: float, rf: float, price: float) -> float:
+    """Helper function to compute the model price (with pricer `f`) at
+    volatility `x`, less the market price.
+    """
+
+    return f(current=current, volatility=x, ttm=ttm, strike=strike,
+             rf=rf) - price
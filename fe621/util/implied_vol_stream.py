@@ -0,0 +1,135 @@
+from .implied_vol import chainSummary
+from .. import black_scholes
+
+from typing import Iterable, Iterator, Tuple
+import numpy as np
+import pandas as pd
+
+
+class ImpliedVolStream():
+    """Incremental implied volatility computation for a chain of Option
+    contracts, consuming minute bars as they arrive (i.e. without the full day
+    of data in the form created by the `util.loadData` function).
+
+    Each bar is solved for every contract at once (see
+    `ChainContext.impliedVol`), warm-started from the last solution of each
+    contract. Running aggregates (the mean, the exponentially weighted moving
+    average and the last value of the implied volatility of each contract)
+    are updated with every bar, in constant memory.
+    """
+
+    def __init__(self, names: list, rf: float, current_date: str,
+                 tol: float=1e-8, span: float=30):
+        """Initialization method for the `ImpliedVolStream` class.
+
+        Arguments:
+            names {list} -- Names of the option contracts.
+            rf {float} -- Risk-free rate.
+            current_date {str} -- Current date (of data) in the form:
+                                  YYYY-MM-DD.
+
+        Keyword Arguments:
+            tol {float} -- Tolerance level of the estimate (default: {1e-8}).
+            span {float} -- Span (in bars) of the exponentially weighted
+                            moving average (default: {30}).
+        """
+
+        self.names = list(names)
+        self.tol = tol
+        self.alpha = 2 / (span + 1)
+
+        # Invariant inputs of the chain, computed once
+        self.context = black_scholes.ChainContext(names=self.names, rf=rf,
+                                                  current_date=current_date)
+
+        # Running aggregates of each contract
+        n = len(self.names)
+        self.count = np.zeros(n, dtype=int)
+        self.total = np.zeros(n)
+        self.ewma = np.full(n, np.nan)
+        self.last = np.full(n, np.nan)
+        self.timestamp = None
+
+    def update(self, timestamp: object, current: float,
+               prices: np.array) -> np.array:
+        """Function to solve the implied volatilities of a single bar, and
+        update the running aggregates.
+
+        Arguments:
+            timestamp {object} -- Timestamp of the bar.
+            current {float} -- Price of the underlying asset.
+            prices {np.array} -- Option prices; an array in the order of
+                                 `names`, or a mapping (e.g. dict or
+                                 pd.Series) of contract name to price, where
+                                 missing contracts are skipped.
+
+        Returns:
+            np.array -- Implied volatility of each contract (NaN if missing,
+                        or if no solution is found).
+        """
+
+        # Aligning prices to the contracts of the chain
+        if hasattr(prices, 'get'):
+            prices = [prices.get(name, np.nan) for name in self.names]
+        prices = np.asarray(prices, dtype=float)
+
+        # Solving the bar, warm-started from the last solutions
+        imp_vols = self.context.impliedVol(current=current, price=prices,
+                                           tol=self.tol, guess=self.last)
+
+        # Updating the aggregates of the solved contracts
+        solved = ~np.isnan(imp_vols)
+        self.count[solved] += 1
+        self.total[solved] += imp_vols[solved]
+        self.ewma[solved] = np.where(
+            np.isnan(self.ewma[solved]), imp_vols[solved],
+            (self.alpha * imp_vols[solved])
+            + ((1 - self.alpha) * self.ewma[solved]))
+        self.last[solved] = imp_vols[solved]
+        self.timestamp = timestamp
+
+        return imp_vols
+
+    def stream(self, records: Iterable) -> Iterator[Tuple[object, np.array]]:
+        """Generator solving a stream of bars (see `update`).
+
+        Arguments:
+            records {Iterable} -- Iterable of (timestamp, underlying price,
+                                  option prices) records.
+
+        Yields:
+            Tuple[object, np.array] -- Timestamp of each bar, and the implied
+                                       volatility of each contract.
+        """
+
+        for timestamp, current, prices in records:
+            yield (timestamp, self.update(timestamp=timestamp,
+                                          current=current, prices=prices))
+
+    def mean(self) -> np.array:
+        """Function to get the running mean implied volatility of each
+        contract (NaN if none solved yet).
+
+        Returns:
+            np.array -- Mean implied volatility of each contract.
+        """
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.count > 0, self.total / self.count, np.nan)
+
+    def summary(self) -> pd.DataFrame:
+        """Function to get the running aggregates, in the form output by
+        `cleanImpliedVol` (with the mean as 'implied_vol'), with the EWMA,
+        last value and number of implied volatilities added.
+
+        Returns:
+            pd.DataFrame -- Formatted DataFrame.
+        """
+
+        return chainSummary(context=self.context, aggregates={
+            'implied_vol': self.mean(),
+            'implied_vol_ewma': self.ewma,
+            'implied_vol_last': self.last,
+            'count': self.count
+        })
+
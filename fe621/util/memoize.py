@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from typing import Callable
+import numpy as np
+
+
+class PricerCache():
+    """Bounded least-recently-used (LRU) cache wrapping an analytic pricer or
+    implied volatility solver, keyed on its exact (hashable) inputs.
+
+    Minute-bar data produced by `util.loadData` is forward and backward filled,
+    so stale bars of illiquid contracts repeat the same inputs many times in a
+    row. Wrapping the per-bar computation in this cache evaluates each distinct
+    set of inputs only once. The number of cache hits and misses is tracked.
+    """
+
+    def __init__(self, func: Callable, maxsize: int=4096):
+        """Initialization method for the `PricerCache` class.
+
+        Arguments:
+            func {Callable} -- Function to be cached.
+
+        Keyword Arguments:
+            maxsize {int} -- Maximum number of cached results, after which the
+                             least recently used result is evicted
+                             (default: {4096}).
+        """
+
+        self.func = func
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def __call__(self, *args, **kwargs):
+        # Building cache key from positional and (sorted) keyword arguments
+        key = args + tuple(sorted(kwargs.items()))
+
+        # Cache hit; mark as most recently used and return
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        # Cache miss; evaluate, store and evict least recently used if full
+        self.misses += 1
+        value = self.func(*args, **kwargs)
+        self._cache[key] = value
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+        return value
+
+    def cacheInfo(self) -> dict:
+        """Function to get the cache statistics.
+
+        Returns:
+            dict -- Dictionary with the number of 'hits' and 'misses', and the
+                    current and maximum cache size ('size' and 'maxsize').
+        """
+
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._cache), 'maxsize': self.maxsize}
+
+    def clear(self):
+        """Function to empty the cache and reset the statistics.
+        """
+
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def memoize(func: Callable, maxsize: int=4096) -> PricerCache:
+    """Function to wrap a pricer or solver in a bounded LRU cache. See
+    `PricerCache` for more.
+
+    Arguments:
+        func {Callable} -- Function to be cached.
+
+    Keyword Arguments:
+        maxsize {int} -- Maximum number of cached results (default: {4096}).
+
+    Returns:
+        PricerCache -- Cached version of `func`.
+    """
+
+    return PricerCache(func=func, maxsize=maxsize)
+
+
+def dedupeEvaluate(func: Callable, **kwargs) -> np.array:
+    """Function to evaluate a vectorized pricer only on the distinct rows of
+    its inputs, scattering the results back to the full input shape.
+
+    Array arguments are broadcast against each other and each broadcast
+    element is treated as a row of inputs; identical rows (e.g. the repeated
+    (spot, option price) pairs of forward-filled minute bars) are evaluated
+    once. Scalar and non-numeric keyword arguments are passed through
+    unchanged (and `func` is called directly if there are no array
+    arguments).
+
+    Arguments:
+        func {Callable} -- Vectorized function, called with keyword arguments
+                           and returning one value per input row.
+        **kwargs -- Arguments passed to `func`.
+
+    Returns:
+        np.array -- Output of `func` with the broadcast shape of the inputs.
+    """
+
+    # Separating array arguments from pass-through arguments
+    array_kwargs = {k: np.asarray(v) for k, v in kwargs.items()
+                    if isinstance(v, (np.ndarray, list, tuple))}
+    fixed_kwargs = {k: v for k, v in kwargs.items() if k not in array_kwargs}
+
+    # Nothing to deduplicate if every argument is a scalar
+    if not array_kwargs:
+        return np.asarray(func(**kwargs))
+
+    # Broadcasting and flattening array arguments into columns of a table
+    keys = list(array_kwargs)
+    columns = np.broadcast_arrays(*array_kwargs.values())
+    shape = columns[0].shape
+    table = np.column_stack([np.ravel(c).astype(float) for c in columns])
+
+    # Isolating distinct rows, and the mapping back to all rows
+    unique_rows, inverse = np.unique(table, axis=0, return_inverse=True)
+
+    # Evaluating on distinct rows only
+    unique_kwargs = {k: unique_rows[:, i] for i, k in enumerate(keys)}
+    values = np.asarray(func(**unique_kwargs, **fixed_kwargs))
+
+    # Scattering back to the full input shape
+    return values[np.ravel(inverse)].reshape(shape)
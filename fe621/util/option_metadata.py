@@ -1,8 +1,84 @@
 from . import cfg
 from datetime import datetime
+from typing import Iterable, Tuple
+import functools
+import pandas as pd
 import re
 
 
+# Standard (OCC) option contract name; the underlying symbol (optionally
+# padded with spaces), followed by the expiration date (YYMMDD), the option
+# type (C or P) and the strike price (first 5 digits in $, last 3 in
+# 1/1000th $). See https://regexr.com for more info
+_contract_re = re.compile(r'(?P<underlying>.*?)\s*'
+                          r'(?P<year>\d{2})(?P<month>\d{2})(?P<day>\d{2})'
+                          r'(?P<type>[CP])(?P<dollars>\d{5})'
+                          r'(?P<thousandths>\d{3})')
+
+
+def parseContracts(names: Iterable[str], current_date: str=None) \
+                   -> pd.DataFrame:
+    """Function to parse the standard names of a sequence of option contracts
+    into a table of contract metadata. Each name is matched once with a
+    compiled pattern, and the fields are converted to their types column-wise
+    (rather than contract by contract).
+
+    Arguments:
+        names {Iterable[str]} -- Names of the option contracts.
+
+    Keyword Arguments:
+        current_date {str} -- Date in YYYY-MM-DD format, used to compute the
+                              time to maturity; the 'ttm' column is omitted if
+                              None (default: {None}).
+
+    Raises:
+        ValueError: Raised if a name is not a standard option contract name.
+
+    Returns:
+        pd.DataFrame -- DataFrame (in the order of `names`) with columns
+                        'name', 'underlying', 'expiration' (datetime), 'type'
+                        ('C' or 'P'), 'is_call' (bool), 'strike' (float) and
+                        'ttm' (float; in years, with `cfg.days_in_year` days
+                        per year).
+    """
+
+    names = list(names)
+
+    # Matching every name with the compiled pattern
+    matches = [_contract_re.search(name) for name in names]
+    invalid = [name for name, match in zip(names, matches) if match is None]
+    if invalid:
+        raise ValueError('Invalid option contract name(s): {0}'
+                         .format(invalid))
+
+    # Fields of every name, converted to their types column-wise
+    fields = pd.DataFrame([match.groups() for match in matches],
+                          columns=list(_contract_re.groupindex))
+    expiration = pd.to_datetime(pd.DataFrame({
+        'year': 2000 + fields['year'].astype(int),
+        'month': fields['month'].astype(int),
+        'day': fields['day'].astype(int)
+    }))
+
+    # Typed contract table
+    contracts = pd.DataFrame({
+        'name': names,
+        'underlying': fields['underlying'],
+        'expiration': expiration,
+        'type': fields['type'],
+        'is_call': fields['type'] == 'C',
+        'strike': fields['dollars'].astype(float)
+                  + (fields['thousandths'].astype(float) / 1000)
+    })
+
+    # Time to maturity, from the current date (parsed once)
+    if current_date is not None:
+        ttm_days = (contracts['expiration'] - _parseDate(current_date)).dt.days
+        contracts['ttm'] = ttm_days / cfg.days_in_year
+
+    return contracts
+
+
 def isCallOption(name: str) -> bool:
     """Function to determine the type of an option contract from its
     standard name.
@@ -14,14 +90,7 @@ def isCallOption(name: str) -> bool:
         bool -- True if Call option, False otherwise.
     """
 
-    # Defining search Regex, see https://regexr.com for more info
-    option_type_search_re = '\d{6}(C|P{1})\d{8}'
-
-    # Searching name for option type designation
-    match = re.search(pattern=option_type_search_re, string=name)
-
-    # Return True if Call, False otherwise
-    return match[1] is 'C'
+    return _parseContract(name)[2]
 
 
 def getOptionType(name: str) -> str:
@@ -49,16 +118,7 @@ def getStrikePrice(name: str) -> float:
         float -- Strike price of the option contract.
     """
 
-    # Defning search Regex, see https://regexr.com for more info
-    strike_price_search_re = '\d{6}.{1}(\d{5})(\d{3})'
-
-    # Searching name for strike price
-    match = re.search(pattern=strike_price_search_re, string=name)
-
-    # Computing strike price (first part in $, second in 1/1000th $)
-    strike = float(match[1]) + (float(match[2]) / 1000)
-
-    return strike
+    return _parseContract(name)[3]
 
 
 def getExpiration(name: str) -> datetime:
@@ -72,21 +132,7 @@ def getExpiration(name: str) -> datetime:
         datetime -- Expiration date of the option contract.
     """
 
-    # Defining search Regex, see https://regexr.com for more info
-    exp_date_search_re = '.{1,}(\d{2})(\d{2})(\d{2}).{1}\d{8}'
-
-    # Searching name for the expiration date
-    match = re.search(pattern=exp_date_search_re, string=name)
-
-    # Adding 2000 to current year (expressed in 2 digits in standard name)
-    exp_year = '20' + match[1]
-
-    # Creating date object with expiration date information
-    exp_date = datetime(year=int(exp_year), month=int(match[2]),
-                        day=int(match[3]))
-
-    # Return date object with option expiration date
-    return exp_date
+    return _parseContract(name)[1]
 
 
 def getTTM(name: str, current_date: str) -> float:
@@ -101,17 +147,30 @@ def getTTM(name: str, current_date: str) -> float:
         float -- TTM (in years, with 365 days per year).
     """
 
-    exp_date = getExpiration(name=name)
+    # Getting number of days from current date (parsed once) to expiration
+    ttm_days = (getExpiration(name=name) - _parseDate(current_date)).days
 
-    # Creating current date object by parsing input string
-    current_date_format = '%Y-%m-%d'
-    current_date = datetime.strptime(current_date, current_date_format)
+    # Converting to years (with the configured days per year), return
+    return float(ttm_days / cfg.days_in_year)
 
-    # Defining days in year
-    days = cfg.days_in_year
 
-    # Getting number of days from current date to expiration date
-    ttm_days = (exp_date - current_date).days
+@functools.lru_cache(maxsize=4096)
+def _parseContract(name: str) -> Tuple[str, datetime, bool, float]:
+    """Helper function to look up the (underlying, expiration, is call,
+    strike) fields of a single option contract in its `parseContracts` row,
+    cached so that repeated lookups of the same contract do not re-run the
+    parser.
+    """
+
+    contract = parseContracts(names=[name]).iloc[0]
+
+    return (contract['underlying'], contract['expiration'].to_pydatetime(),
+            bool(contract['is_call']), float(contract['strike']))
+
+
+@functools.lru_cache(maxsize=64)
+def _parseDate(date: str) -> datetime:
+    """Helper function to parse (and cache) a date in YYYY-MM-DD format.
+    """
 
-    # Converting to years, return
-    return float(ttm_days / days)
+    return datetime.strptime(date, '%Y-%m-%d')
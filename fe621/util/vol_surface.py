@@ -0,0 +1,279 @@
+from . import option_metadata
+
+import numpy as np
+import pandas as pd
+
+
+class VolSurface():
+    """Parametric implied volatility surface, built from raw SVI slices.
+
+    Each expiration is fitted with the raw SVI parameterization of total
+    implied variance (Gatheral, 2004), in log forward moneyness
+    k = ln(K / F):
+
+        w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + sigma^2))
+
+    For fixed (m, sigma), the slice is linear in (a, b * rho, b), so it is
+    fitted by least squares on a grid of (m, sigma) candidates at once (a
+    batch of 3x3 normal equations), zooming in on the best candidate
+    (Zeliade, 2009). Between fitted expirations, total variance is linearly
+    interpolated in time at constant forward moneyness, and it is
+    extrapolated at constant implied volatility outside of them.
+
+    Fitted parameters are cached per expiration, so that refitting only
+    solves the slices whose data changed (warm-started from their previous
+    parameters).
+    """
+
+    def __init__(self, current: float, rf: float, current_date: str,
+                 dividend: float=0, grid: int=21, rounds: int=8):
+        """Initialization method for the `VolSurface` class.
+
+        Arguments:
+            current {float} -- Current price of the underlying asset.
+            rf {float} -- Risk-free rate.
+            current_date {str} -- Current date (of data) in the form:
+                                  YYYY-MM-DD.
+
+        Keyword Arguments:
+            dividend {float} -- Dividend yield (annual) (default: {0}).
+            grid {int} -- Number of (m, sigma) candidates per dimension, in
+                          each round of the fit (default: {21}).
+            rounds {int} -- Number of zoom rounds of the fit (default: {8}).
+        """
+
+        self.current = current
+        self.rf = rf
+        self.current_date = current_date
+        self.dividend = dividend
+        self.grid = grid
+        self.rounds = rounds
+
+        # Fitted slices, by expiration
+        self._slices = dict()
+
+        # Flat arrays of the fitted slices (sorted by ttm), for queries
+        self._ttm = np.array([])
+        self._params = np.empty((5, 0))
+
+    def fit(self, data: pd.DataFrame, min_points: int=5) -> 'VolSurface':
+        """Function to fit (or refit) the SVI slices of the surface.
+
+        Slices are fitted to every row of `data` with a finite implied
+        volatility, so the data should be filtered beforehand if required
+        (e.g. to out-of-the-money options only). Expirations that are not in
+        `data` keep their fitted slices, and slices whose data is unchanged
+        are not refitted.
+
+        Arguments:
+            data {pd.DataFrame} -- Implied volatilities, in the form output
+                                   by `cleanImpliedVol` (i.e. with 'name',
+                                   'expiration', 'strike' and 'implied_vol'
+                                   columns).
+
+        Keyword Arguments:
+            min_points {int} -- Minimum number of implied volatilities of an
+                                expiration to fit its slice; expirations with
+                                fewer (or that have expired) are skipped
+                                (default: {5}).
+
+        Returns:
+            VolSurface -- The fitted surface (i.e. self).
+        """
+
+        data = data[np.isfinite(data['implied_vol'].astype(float))]
+
+        # Time to maturity of each contract
+        ttm = option_metadata.parseContracts(
+            names=data['name'], current_date=self.current_date)['ttm'].values
+
+        for expiration, index in data.groupby('expiration').indices.items():
+            t = ttm[index[0]]
+            if (t <= 0) or (index.size < min_points):
+                continue
+
+            # Total implied variance, by log forward moneyness
+            k = np.log(data['strike'].values[index].astype(float)
+                       / self._forward(t))
+            w = np.power(data['implied_vol'].values[index].astype(float),
+                         2) * t
+            order = np.argsort(k, kind='stable')
+            k, w = k[order], w[order]
+
+            # Skipping unchanged slices
+            key = (t, k.tobytes(), w.tobytes())
+            cached = self._slices.get(expiration)
+            if (cached is not None) and (cached['key'] == key):
+                continue
+
+            # Fitting, warm-started from the previous parameters if any
+            params, rmse = _fitSlice(
+                k=k, w=w, grid=self.grid, rounds=self.rounds,
+                warm=None if cached is None else cached['params'])
+
+            self._slices[expiration] = {'key': key, 'ttm': t,
+                                        'params': params, 'rmse': rmse}
+
+        # Rebuilding the query arrays, sorted by ttm; parameters by row, and
+        # the ttm of the previous slice and inverse gap to it (0 for the
+        # first slice) for the interpolation
+        slices = sorted(self._slices.values(), key=lambda s: s['ttm'])
+        self._ttm = np.array([s['ttm'] for s in slices])
+        self._params = np.array([s['params'] for s in slices]).reshape(-1, 5).T
+        self._prev_ttm = np.concatenate([self._ttm[:1], self._ttm[:-1]])
+        self._inv_gap = np.concatenate([[0], 1 / np.diff(self._ttm)])
+
+        return self
+
+    @property
+    def params(self) -> pd.DataFrame:
+        """Fitted SVI parameters of each expiration (with the ttm and
+        root-mean-square error of the fit in total variance).
+        """
+
+        columns = ['expiration', 'ttm', 'a', 'b', 'rho', 'm', 'sigma', 'rmse']
+
+        return pd.DataFrame([
+            [expiration, s['ttm'], *s['params'], s['rmse']]
+            for expiration, s in self._slices.items()
+        ], columns=columns).sort_values(by='ttm').reset_index(drop=True)
+
+    def totalVariance(self, strike: np.array, ttm: np.array) -> np.array:
+        """Function to compute the total implied variance of the surface, for
+        arrays of strike prices and times to expiration (broadcast against
+        each other).
+
+        Arguments:
+            strike {np.array} -- Strike price(s).
+            ttm {np.array} -- Time(s) to expiration (in years).
+
+        Raises:
+            ValueError: Raised if no slice has been fitted.
+
+        Returns:
+            np.array -- Total implied variance.
+        """
+
+        if self._ttm.size == 0:
+            raise ValueError('The surface has no fitted slices.')
+
+        ttm = np.asarray(ttm, dtype=float)
+
+        # Log forward moneyness at the queried ttms
+        k = np.log(np.asarray(strike, dtype=float) / self.current) \
+            - ((self.rf - self.dividend) * ttm)
+
+        # Fitted slices on either side of each ttm
+        T = self._ttm
+        upper = np.minimum(np.searchsorted(T, ttm), T.size - 1)
+        lower = np.maximum(upper - 1, 0)
+
+        # Linear interpolation in time, at constant moneyness
+        weight = np.minimum(np.maximum(
+            (ttm - self._prev_ttm[upper]) * self._inv_gap[upper], 0), 1)
+        w = ((1 - weight) * _sviTotalVariance(k, self._params[:, lower])) \
+            + (weight * _sviTotalVariance(k, self._params[:, upper]))
+
+        # Constant implied volatility outside of the fitted slices
+        return w * (ttm / np.minimum(np.maximum(ttm, T[0]), T[-1]))
+
+    def impliedVol(self, strike: np.array, ttm: np.array) -> np.array:
+        """Function to compute the implied volatility of the surface, for
+        arrays of strike prices and times to expiration (broadcast against
+        each other).
+
+        Arguments:
+            strike {np.array} -- Strike price(s).
+            ttm {np.array} -- Time(s) to expiration (in years).
+
+        Returns:
+            np.array -- Implied volatility (NaN for non-positive ttms).
+        """
+
+        ttm = np.asarray(ttm, dtype=float)
+        w = self.totalVariance(strike=strike, ttm=ttm)
+
+        # Dividing by NaN (rather than zero) for non-positive ttms
+        return np.sqrt(np.maximum(w, 0) / np.where(ttm > 0, ttm, np.nan))
+
+    def _forward(self, ttm: float) -> float:
+        """Helper function to compute the forward price of the underlying.
+        """
+
+        return self.current * np.exp((self.rf - self.dividend) * ttm)
+
+
+def _sviTotalVariance(k: np.array, params: np.array) -> np.array:
+    """Helper function to evaluate raw SVI total variance at log moneyness
+    `k`, with parameters (a, b, rho, m, sigma) in the first axis of `params`.
+    """
+
+    a, b, rho, m, sigma = params
+
+    return a + (b * ((rho * (k - m)) + np.sqrt(np.power(k - m, 2)
+                                               + np.power(sigma, 2))))
+
+
+def _fitSlice(k: np.array, w: np.array, grid: int, rounds: int,
+              warm: np.array=None) -> tuple:
+    """Helper function to fit a raw SVI slice to total variances `w` at log
+    moneyness `k`. Returns the (a, b, rho, m, sigma) parameters and the
+    root-mean-square error of the fit.
+    """
+
+    # Search region of (m, sigma); around the previous solution if given
+    span = max(k[-1] - k[0], 1e-2)
+    if warm is None:
+        m_lo, m_hi = k[0] - span, k[-1] + span
+        s_lo, s_hi = 1e-4, 2 * span
+    else:
+        m_lo, m_hi = warm[3] - (span / 4), warm[3] + (span / 4)
+        s_lo, s_hi = max(warm[4] - (span / 4), 1e-4), warm[4] + (span / 4)
+
+    best = None
+    for _ in range(rounds):
+        # Candidate (m, sigma) pairs, as columns
+        m, sigma = [x.ravel()[:, None] for x in np.meshgrid(
+            np.linspace(m_lo, m_hi, grid), np.linspace(s_lo, s_hi, grid))]
+
+        # Linear least squares of w = a + d * y + c * sqrt(y^2 + 1), with
+        # y = (k - m) / sigma, c = b * sigma and d = rho * b * sigma, for
+        # every candidate at once
+        y = (k - m) / sigma
+        z = np.sqrt(np.power(y, 2) + 1)
+        X = np.stack([np.ones_like(y), y, z], axis=-1)
+        XtX = np.einsum('gni,gnj->gij', X, X)
+        Xtw = np.einsum('gni,n->gi', X, w)
+
+        # Small ridge (relative to the scale of each system), as y and z are
+        # nearly collinear when sigma is small and m is outside the data
+        ridge = 1e-10 * np.trace(XtX, axis1=1, axis2=2)[:, None, None]
+        coef = np.linalg.solve(XtX + (ridge * np.eye(3)),
+                               Xtw[..., None])[..., 0]
+
+        # Projecting onto b >= 0 and |rho| <= 1, refitting the level
+        c = np.maximum(coef[:, 2], 0)
+        d = np.clip(coef[:, 1], -1 * c, c)
+        a = np.mean(w - (d[:, None] * y) - (c[:, None] * z), axis=1)
+
+        # Best candidate (ignoring degenerate systems)
+        residual = a[:, None] + (d[:, None] * y) + (c[:, None] * z) - w
+        error = np.mean(np.power(residual, 2), axis=1)
+        error[~np.isfinite(error)] = np.inf
+        i = np.argmin(error)
+        if (best is None) or (error[i] <= best[-1]):
+            best = (a[i], c[i], d[i], m[i, 0], sigma[i, 0], error[i])
+
+        # Zooming in on the best candidate
+        m_step = (m_hi - m_lo) / (grid - 1)
+        s_step = (s_hi - s_lo) / (grid - 1)
+        m_lo, m_hi = best[3] - (2 * m_step), best[3] + (2 * m_step)
+        s_lo = max(best[4] - (2 * s_step), 1e-4)
+        s_hi = best[4] + (2 * s_step)
+
+    # Raw SVI parameters (a, b, rho, m, sigma)
+    a, c, d, m, sigma, error = best
+    b = c / sigma
+    rho = d / c if c > 0 else 0.0
+
+    return (np.array([a, b, rho, m, sigma]), float(np.sqrt(error)))
@@ -0,0 +1,9 @@
+import os
+import sys
+
+try:
+    import fe621
+except ModuleNotFoundError:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__),
+                                                    '..')))
+    import fe621
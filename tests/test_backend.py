@@ -0,0 +1,76 @@
+from context import fe621
+
+import numpy as np
+import pytest
+
+
+# Parity of the compiled kernels with the NumPy implementations
+pytest.importorskip('numba')
+
+current, volatility, ttm, rf = 100.0, 0.25, 0.5, 0.03
+
+
+def onBackends(compute) -> list:
+    """Result of `compute()` with the NumPy and numba backends, in order."""
+
+    default = fe621.util.cfg.backend
+    results = []
+    try:
+        for backend in ('numpy', 'numba'):
+            fe621.util.cfg.backend = backend
+            results.append(compute())
+    finally:
+        fe621.util.cfg.backend = default
+
+    return results
+
+
+def test_chain_parity():
+    spots = np.linspace(80, 120, 50)[:, None]
+    strikes = np.linspace(50, 150, 40)[None, :]
+    is_call = (np.arange(40) % 2 == 0)[None, :]
+
+    chains = onBackends(lambda: fe621.black_scholes.chain(
+        current=spots, volatility=volatility, ttm=ttm, strike=strikes,
+        rf=rf))
+    prices = onBackends(lambda: fe621.black_scholes.chainPrice(
+        current=spots, volatility=volatility, ttm=ttm, strike=strikes,
+        rf=rf, is_call=is_call))
+
+    for numpy_prices, numba_prices in zip(*chains):
+        assert np.allclose(numba_prices, numpy_prices, rtol=1e-12,
+                           atol=1e-12)
+    assert np.allclose(prices[1], prices[0], rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('solve', [
+    fe621.util.implied_vol._solveImpliedVolBisection,
+    fe621.util.implied_vol._solveImpliedVolNewton
+])
+@pytest.mark.parametrize('strike, is_call', [(90.0, True), (110.0, False)])
+def test_implied_vol_solver_parity(solve, strike, is_call):
+    pricer = fe621.black_scholes.call if is_call else fe621.black_scholes.put
+    price = pricer(current=current, volatility=volatility, ttm=ttm,
+                   strike=strike, rf=rf)
+
+    solutions = onBackends(lambda: solve(current=current, price=price,
+                                         ttm=ttm, strike=strike, rf=rf,
+                                         is_call=is_call, tol=1e-10))
+
+    # Same sequence of iterates, at the pricing volatility
+    assert solutions[1] == pytest.approx(solutions[0], abs=1e-12)
+    assert solutions[1] == pytest.approx(volatility, abs=1e-8)
+
+
+@pytest.mark.parametrize('tree', [fe621.tree_pricing.binomial.Trigeorgis,
+                                  fe621.tree_pricing.trinomial.AdditiveTree])
+@pytest.mark.parametrize('opt_type, opt_style', [('C', 'E'), ('P', 'A')])
+def test_lattice_parity(tree, opt_type, opt_style):
+    trees = onBackends(lambda: tree(
+        current=current, strike=105.0, ttm=ttm, rf=rf, volatility=volatility,
+        opt_type=opt_type, opt_style=opt_style, steps=50))
+
+    assert np.allclose(trees[1].getPriceTree(), trees[0].getPriceTree(),
+                       rtol=1e-12, atol=1e-12)
+    assert trees[1].getInstrumentValue() \
+        == pytest.approx(trees[0].getInstrumentValue(), rel=1e-12)
@@ -0,0 +1,127 @@
+from context import fe621
+
+import numpy as np
+import pytest
+
+
+# Contract, with daily barrier monitoring over 63 trading days
+S, K, volatility, ttm, rf = 100.0, 100.0, 0.3, 0.25, 0.05
+monitoring_freq = 252
+steps = int(round(ttm * monitoring_freq))
+
+
+def monitoredMonteCarlo(H: float, up: bool, paths: int=200000,
+                        seed: int=0) -> tuple:
+    """Monte Carlo price (and standard error) of an Out barrier Call option,
+    with the barrier checked only at the monitoring dates.
+    """
+
+    rng = np.random.default_rng(seed)
+    dt = ttm / steps
+    payoffs = []
+    for _ in range(paths // 100000):
+        # Log price at each monitoring date
+        z = rng.standard_normal((100000, steps))
+        log_S = np.log(S) + np.cumsum(((rf - (volatility ** 2 / 2)) * dt)
+                                      + (volatility * np.sqrt(dt) * z),
+                                      axis=1)
+
+        # Paths never at or beyond the barrier on a monitoring date
+        alive = (log_S.max(axis=1) < np.log(H)) if up \
+            else (log_S.min(axis=1) > np.log(H))
+        payoffs.append(np.exp(-1 * rf * ttm) * alive
+                       * np.maximum(np.exp(log_S[:, -1]) - K, 0))
+
+    payoffs = np.concatenate(payoffs)
+    return (payoffs.mean(), payoffs.std(ddof=1) / np.sqrt(payoffs.size))
+
+
+@pytest.mark.parametrize('H, barrier_type', [(120.0, 'UO'), (90.0, 'DO')])
+def test_discrete_barrier_matches_monitored_monte_carlo(H, barrier_type):
+    estimate, standard_error = monitoredMonteCarlo(H=H,
+                                                   up=barrier_type == 'UO')
+
+    discrete = fe621.black_scholes.barrier.price(
+        S=S, H=H, volatility=volatility, ttm=ttm, K=K, rf=rf, opt_type='C',
+        barrier_type=barrier_type, monitoring_freq=monitoring_freq)
+    continuous = fe621.black_scholes.barrier.price(
+        S=S, H=H, volatility=volatility, ttm=ttm, K=K, rf=rf, opt_type='C',
+        barrier_type=barrier_type)
+
+    # Within 3 standard errors, plus 0.01 for the O(1 / m) bias of the
+    # correction (measured against 1e6 paths)
+    assert abs(discrete - estimate) < (3 * standard_error) + 0.01
+
+    # The correction improves on the continuous formula
+    assert abs(discrete - estimate) < abs(continuous - estimate)
+
+
+@pytest.mark.parametrize('H, barrier_type', [(120.0, 'UO'), (90.0, 'DO')])
+def test_discrete_barrier_matches_monitored_tree(H, barrier_type):
+    # Trigeorgis barrier tree, with one step per monitoring date
+    tree = fe621.tree_pricing.binomial.Barrier(
+        current=S, strike=K, ttm=ttm, rf=rf, volatility=volatility,
+        barrier=H, barrier_type='O', opt_type='C', opt_style='E',
+        steps=steps).getInstrumentValue()
+
+    discrete = fe621.black_scholes.barrier.price(
+        S=S, H=H, volatility=volatility, ttm=ttm, K=K, rf=rf, opt_type='C',
+        barrier_type=barrier_type, monitoring_freq=monitoring_freq)
+    continuous = fe621.black_scholes.barrier.price(
+        S=S, H=H, volatility=volatility, ttm=ttm, K=K, rf=rf, opt_type='C',
+        barrier_type=barrier_type)
+
+    # Within 5%, as the tree carries its own bias from the placement of the
+    # nodes relative to the barrier
+    assert tree == pytest.approx(discrete, rel=0.05)
+
+    # The correction improves on the continuous formula
+    assert abs(discrete - tree) < abs(continuous - tree)
+
+
+def test_call_up_and_out_discrete_matches_reiner_rubinstein():
+    closed_form = fe621.black_scholes.barrier.callUpAndOut(
+        S=S, H=120.0, volatility=volatility, ttm=ttm, K=K, rf=rf,
+        monitoring_freq=monitoring_freq)
+    reiner_rubinstein = fe621.black_scholes.barrier.price(
+        S=S, H=120.0, volatility=volatility, ttm=ttm, K=K, rf=rf,
+        opt_type='C', barrier_type='UO', monitoring_freq=monitoring_freq)
+
+    assert closed_form == pytest.approx(reiner_rubinstein, rel=1e-10)
+
+
+@pytest.mark.parametrize('opt_type, barrier_type, H', [
+    ('C', 'UO', 120.0), ('C', 'DI', 85.0), ('P', 'UI', 120.0),
+    ('P', 'DO', 85.0)
+])
+def test_barrier_greeks_match_finite_differences(opt_type, barrier_type, H):
+    # Scalar underlying price, against arrays of strikes and barriers
+    strikes = np.array([90.0, 95.0, 100.0, 105.0, 110.0])
+    barriers = np.array([[H], [H * 1.05 if barrier_type[0] == 'U'
+                               else H * 0.95]])
+    kwargs = dict(H=barriers, K=strikes, rf=rf, opt_type=opt_type,
+                  barrier_type=barrier_type, rebate=1.0)
+
+    greeks = fe621.black_scholes.barrier.barrierGreeks(
+        S=S, volatility=volatility, ttm=ttm, **kwargs)
+
+    def price(S=S, volatility=volatility, ttm=ttm):
+        return fe621.black_scholes.barrier.price(
+            S=S, volatility=volatility, ttm=ttm, **kwargs)
+
+    # Central differences
+    dS, dvol, dttm = 1e-2, 1e-4, 1e-5
+    expected = {
+        'price': price(),
+        'delta': (price(S=S + dS) - price(S=S - dS)) / (2 * dS),
+        'gamma': (price(S=S + dS) - (2 * price()) + price(S=S - dS))
+                 / (dS ** 2),
+        'vega': (price(volatility=volatility + dvol)
+                 - price(volatility=volatility - dvol)) / (2 * dvol),
+        'theta': -1 * (price(ttm=ttm + dttm) - price(ttm=ttm - dttm))
+                 / (2 * dttm)
+    }
+
+    for greek, value in expected.items():
+        assert greeks[greek].shape == (2, 5)
+        assert greeks[greek] == pytest.approx(value, rel=1e-4, abs=1e-5)
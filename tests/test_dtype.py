@@ -0,0 +1,90 @@
+from context import fe621
+
+import numpy as np
+import pytest
+
+
+# Contract priced at both precisions
+current, strike, ttm, rf, volatility = 100.0, 105.0, 0.5, 0.03, 0.25
+
+
+@pytest.fixture
+def single_precision():
+    """Fixture setting `cfg.dtype` to single precision for a test."""
+
+    default = fe621.util.cfg.dtype
+    fe621.util.cfg.dtype = np.float32
+    yield
+    fe621.util.cfg.dtype = default
+
+
+@pytest.mark.parametrize('tree', [fe621.tree_pricing.binomial.Trigeorgis,
+                                  fe621.tree_pricing.trinomial.AdditiveTree])
+@pytest.mark.parametrize('opt_type, opt_style', [('C', 'E'), ('P', 'A')])
+def test_tree_float32_error_bound(tree, opt_type, opt_style):
+    prices = [
+        tree(current=current, strike=strike, ttm=ttm, rf=rf,
+             volatility=volatility, opt_type=opt_type, opt_style=opt_style,
+             steps=50, dtype=dtype).getInstrumentValue()
+        for dtype in (np.float32, np.float64)
+    ]
+
+    # Within 1e-4 (measured errors are up to 4e-5)
+    assert prices[0] == pytest.approx(prices[1], abs=1e-4)
+
+
+def test_monte_carlo_float32_draws():
+    # Discounted Call payoff of a single-step GBM path (recording the
+    # precision of the normals)
+    drift = (rf - (volatility ** 2 / 2)) * ttm
+    dtypes = set()
+
+    def payoff(x: np.array) -> float:
+        dtypes.add(x.dtype)
+        return np.exp(-1 * rf * ttm) * np.maximum(
+            (current * np.exp(drift + (volatility * np.sqrt(ttm) * x[0, 0])))
+            - strike, 0)
+
+    runs = [
+        fe621.monte_carlo.monteCarloSkeleton(
+            sim_count=20000, eval_count=1, sim_func=payoff, dtype=np.float32,
+            rng=np.random.default_rng(0))
+        for _ in range(2)
+    ]
+
+    # Normals drawn natively in single precision, reproducibly
+    assert dtypes == {np.dtype(np.float32)}
+    assert np.array_equal(runs[0], runs[1])
+
+    # Within 4 standard errors of the closed form price
+    stats = fe621.monte_carlo.monteCarloStats(mc_output=runs[0])
+    closed_form = fe621.black_scholes.call(current=current,
+                                           volatility=volatility, ttm=ttm,
+                                           strike=strike, rf=rf)
+    assert abs(stats['estimate'] - closed_form) \
+        < 4 * stats['standard_error']
+
+
+def test_chain_float32_error_bound():
+    spots = np.linspace(80, 120, 200)[:, None]
+    strikes = np.linspace(50, 150, 50)[None, :]
+
+    single = fe621.black_scholes.chain(current=spots, volatility=volatility,
+                                       ttm=ttm, strike=strikes, rf=rf,
+                                       dtype=np.float32)
+    double = fe621.black_scholes.chain(current=spots, volatility=volatility,
+                                       ttm=ttm, strike=strikes, rf=rf,
+                                       dtype=np.float64)
+
+    # Within 1e-4 absolute (measured errors are up to 2e-5)
+    for s, d in zip(single, double):
+        assert s.dtype == np.float32
+        assert np.max(np.abs(s - d)) < 1e-4
+
+
+def test_grid_follows_cfg_dtype(single_precision):
+    prices = fe621.black_scholes.evaluateGrid(
+        fe621.black_scholes.chainPrice, current=np.linspace(80, 120, 50),
+        volatility=volatility, ttm=ttm, strike=strike, rf=rf, is_call=True)
+
+    assert prices.dtype == np.float32
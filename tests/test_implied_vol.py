@@ -0,0 +1,50 @@
+from context import fe621
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+# Minute bars of an underlying, and contracts priced at a known volatility
+current_date, rf, volatility = '2019-02-06', 0.024, 0.2
+contracts = ['SPY190315C00270000', 'SPY190315P00265000',
+             'SPY190418C00280000', 'SPY190418P00260000']
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """Fixture of synthetic price data, in the form of `util.loadData`."""
+
+    index = pd.date_range(current_date + ' 9:30', periods=6, freq='1min')
+    current = np.array([270.0, 270.4, 269.8, 270.9, 271.3, 270.6])
+    data = pd.DataFrame({'SPY': current}, index=index)
+
+    for name in contracts:
+        pricer = fe621.black_scholes.call \
+            if fe621.util.isCallOption(name=name) else fe621.black_scholes.put
+        ttm = fe621.util.getTTM(name=name, current_date=current_date)
+        data[name] = [pricer(current=s, volatility=volatility, ttm=ttm,
+                             strike=fe621.util.getStrikePrice(name=name),
+                             rf=rf) for s in current]
+
+    return data
+
+
+@pytest.mark.parametrize('compute', [
+    fe621.util.computeAvgImpliedVolBisection,
+    fe621.util.computeAvgImpliedVolNewton,
+    fe621.util.computeAvgImpliedVolSequential
+])
+def test_sharded_avg_implied_vol(compute, data):
+    serial = compute(data=data, name='SPY', rf=rf, current_date=current_date,
+                     tol=1e-8)
+    sharded = compute(data=data, name='SPY', rf=rf,
+                      current_date=current_date, tol=1e-8, processes=2)
+
+    # Every contract, recovered at the pricing volatility
+    assert sorted(sharded['name']) == sorted(contracts)
+    assert sharded['implied_vol'].values == pytest.approx(volatility,
+                                                          abs=1e-6)
+
+    # Sharding does not change the result
+    pd.testing.assert_frame_equal(serial, sharded)
@@ -0,0 +1,24 @@
+from context import fe621
+
+import numpy as np
+
+
+def test_dedupe_evaluate_matches_direct():
+    kwargs = dict(current=np.array([100.0, 101.0, 100.0, 101.0]),
+                  strike=np.array([[95.0], [105.0]]), volatility=0.2,
+                  ttm=0.5, rf=0.03)
+
+    deduped = fe621.util.dedupeEvaluate(fe621.black_scholes.call, **kwargs)
+
+    assert deduped.shape == (2, 4)
+    assert np.allclose(deduped, fe621.black_scholes.call(**kwargs))
+
+
+def test_dedupe_evaluate_scalar_arguments():
+    kwargs = dict(current=100.0, strike=105.0, volatility=0.2, ttm=0.5,
+                  rf=0.03)
+
+    deduped = fe621.util.dedupeEvaluate(fe621.black_scholes.call, **kwargs)
+
+    assert deduped.shape == ()
+    assert deduped == fe621.black_scholes.call(**kwargs)
@@ -0,0 +1,37 @@
+from context import fe621
+
+import numpy as np
+import pytest
+
+
+# Equations with a root in [0, 5], of increasing difficulty
+equations = [
+    lambda x: np.exp(x) - 10,
+    lambda x: np.power(x - 1, 3),
+    lambda x: np.cos(x) - x,
+    lambda x: np.arctan(x - 3) - 0.5
+]
+
+
+@pytest.mark.parametrize('tol, max_iter', [
+    (1e-12, 9),  # Converging on the final pass of the iteration budget
+    (1e-12, 4),
+    (1e-12, 100),
+    (1e-6, 100)
+])
+def test_vector_brent_matches_scalar(tol, max_iter):
+    # Every equation solved as one batch, element i being equation i
+    batch = lambda x, index: np.array([equations[i](v)
+                                       for i, v in zip(index, x)])
+    vector = fe621.optimization.vectorBrentSolver(
+        f=batch, a=np.zeros(len(equations)), b=np.full(len(equations), 5.0),
+        tol=tol, max_iter=max_iter)
+
+    for i, f in enumerate(equations):
+        scalar = fe621.optimization.brentSolver(f=f, a=0.0, b=5.0, tol=tol,
+                                                max_iter=max_iter)
+
+        assert vector.status[i] == scalar.status
+        assert vector.root[i] == scalar.root
+        assert vector.iterations[i] == scalar.iterations
+        assert vector.evaluations[i] == scalar.evaluations
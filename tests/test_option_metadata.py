@@ -0,0 +1,25 @@
+from context import fe621
+
+import pytest
+
+
+names = ['SPY190315C00270000', 'SPY   190418P00260500', 'AAPL200117C00007125']
+
+
+def test_scalar_helpers_match_parse_contracts():
+    contracts = fe621.util.parseContracts(names=names,
+                                          current_date='2019-02-06')
+
+    for _, contract in contracts.iterrows():
+        name = contract['name']
+        assert fe621.util.getExpiration(name=name) == contract['expiration']
+        assert fe621.util.isCallOption(name=name) == contract['is_call']
+        assert fe621.util.getOptionType(name=name) == contract['type']
+        assert fe621.util.getStrikePrice(name=name) == contract['strike']
+        assert fe621.util.getTTM(name=name, current_date='2019-02-06') \
+            == contract['ttm']
+
+
+def test_invalid_name():
+    with pytest.raises(ValueError):
+        fe621.util.getStrikePrice(name='SPY')
@@ -0,0 +1,55 @@
+from context import fe621
+
+import numpy as np
+import tracemalloc
+
+
+# Chain of 400 minute bars x 500 strikes
+current = np.linspace(95, 105, 400)[:, None]
+strike = np.linspace(50, 150, 500)[None, :]
+volatility, ttm, rf = 0.25, 0.5, 0.02
+
+
+def test_chain_into_matches_chain():
+    workspace = fe621.black_scholes.ChainWorkspace(shape=(400, 500))
+
+    # Against the NumPy implementation; the compiled kernels round
+    # differently (see test_backend.py)
+    default = fe621.util.cfg.backend
+    fe621.util.cfg.backend = 'numpy'
+    try:
+        call, put = fe621.black_scholes.chain(current=current,
+                                              volatility=volatility,
+                                              ttm=ttm, strike=strike, rf=rf)
+    finally:
+        fe621.util.cfg.backend = default
+    call_into, put_into = fe621.black_scholes.chainInto(
+        current=current, volatility=volatility, ttm=ttm, strike=strike,
+        rf=rf, workspace=workspace)
+
+    # Bitwise equality
+    assert np.array_equal(call, call_into)
+    assert np.array_equal(put, put_into)
+
+
+def test_chain_into_does_not_allocate():
+    workspace = fe621.black_scholes.ChainWorkspace(shape=(400, 500))
+    price = lambda: fe621.black_scholes.chainInto(
+        current=current, volatility=volatility, ttm=ttm, strike=strike,
+        rf=rf, workspace=workspace)
+
+    # Warming up, then tracing repeated repricing
+    price()
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        for _ in range(20):
+            price()
+        end, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # No memory kept, and no chain-sized temporaries (only the fixed-size
+    # iterator buffers NumPy uses for broadcast operands; 1/8th of a buffer)
+    assert end - start < 1024
+    assert peak - start < workspace.call.nbytes / 8